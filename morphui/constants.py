@@ -101,6 +101,11 @@ with open(PATH.ICON_FONTS/'material_icons.toml', 'rb') as f:
 
 @dataclass(frozen=True)
 class _Icon_:
+    DD_MENU_OPEN: str = 'chevron-up'
+    """Icon name shown by dropdown callers while the menu is open."""
+    DD_MENU_CLOSED: str = 'chevron-down'
+    """Icon name shown by dropdown callers while the menu is closed."""
+
     @property
     def MAP(self) -> Dict[str, str]:
         """Mapping of icon names to their actual Unicode characters.
@@ -117,7 +122,7 @@ class _Icon_:
         label.text = icon_char
         
         # Or with the predefined constants
-        label.text = ICON.MAP[ICON.DD_MENU_CLOSED]  # 'chevron-up'
+        label.text = ICON.MAP[ICON.DD_MENU_CLOSED]  # 'chevron-down'
         ```
         """
         return _icon_map_.copy()
@@ -260,6 +260,10 @@ class Typography(EventDispatcher):
     _registered_fonts: Tuple[str, ...]
     """Tuple of currently registered font family names."""
 
+    _icon_characters: Dict[str, str]
+    """Cache of already converted icon characters keyed by icon name.
+    Cleared whenever :attr:`icon_map` changes."""
+
     __events__ = (
         'on_typography_changed',)
 
@@ -267,12 +271,14 @@ class Typography(EventDispatcher):
         super().__init__(**kwargs)
 
         self._registered_fonts = ()
+        self._icon_characters = {}
         for font_dict in self.fonts_to_autoregister:
             self.register_font(**font_dict)
             
         self.bind(
             font_name=self.on_typography_changed,
-            content_styles=self.on_typography_changed)
+            content_styles=self.on_typography_changed,
+            icon_map=self._clear_icon_characters)
 
     @property
     def available_style_properties(self) -> Tuple[str, ...]:
@@ -623,16 +629,30 @@ class Typography(EventDispatcher):
           "0F01C9").
         - The resulting character should be used with appropriate icon 
           fonts.
+        - Converted characters are cached until :attr:`icon_map` 
+          changes.
         """
+        character = self._icon_characters.get(icon_name)
+        if character is not None:
+            return character
+
         assert icon_name in self.icon_map, (
             f'Icon {icon_name!r} not found in icon map')
         
         hex_value = self.icon_map[icon_name]
         try:
-            return chr(int(hex_value, 16))
+            character = chr(int(hex_value, 16))
         except ValueError as e:
             raise ValueError(
                 f'Invalid hex value "{hex_value}" for icon {icon_name!r}') from e
+        
+        self._icon_characters[icon_name] = character
+        return character
+
+    def _clear_icon_characters(self, *args) -> None:
+        """Clear the cached icon characters after :attr:`icon_map`
+        has changed."""
+        self._icon_characters.clear()
     
     def on_typography_changed(self, *args) -> None:
         """Event handler called when typography configuration changes.
@@ -5,6 +5,7 @@ allowing parent widgets to expose and control properties of their child
 widgets through aliased properties.
 """
 from typing import Any
+from typing import Tuple
 
 from kivy.event import EventDispatcher
 from kivy.properties import AliasProperty
@@ -53,6 +54,58 @@ def _is_widget_visible(widget: Any) -> bool:
     return True
 
 
+def _delegate_to_child(
+        owner: EventDispatcher,
+        child: EventDispatcher | None,
+        bound_child: EventDispatcher | None,
+        bound_uids: Tuple[int, ...],
+        bindings: Tuple[Tuple[str, str], ...]) -> Tuple[int, ...]:
+    """Bind parent properties to a child widget and push their values.
+
+    Shared implementation of the leading and trailing widget updates.
+    If `child` differs from `bound_child`, the bindings on the previous
+    child are removed and new ones are created so that changes of the
+    parent properties are forwarded to `child`. Afterwards the current
+    values are written to `child` in the order given by `bindings`.
+    Values the child already holds are not written again, so a refresh
+    of an in-sync child does not trigger its icon update handlers.
+
+    Parameters
+    ----------
+    owner : EventDispatcher
+        The parent widget exposing the delegated properties
+    child : EventDispatcher | None
+        The child widget receiving the property values
+    bound_child : EventDispatcher | None
+        The child widget the bindings are currently applied to
+    bound_uids : Tuple[int, ...]
+        Binding uids returned by `fbind` for `bound_child`, in the
+        same order as `bindings`
+    bindings : Tuple[Tuple[str, str], ...]
+        Pairs of parent property name and child property name
+
+    Returns
+    -------
+    Tuple[int, ...]
+        The binding uids that are active for `child`
+    """
+    if child is not bound_child:
+        for (parent_prop, _), uid in zip(bindings, bound_uids):
+            owner.unbind_uid(parent_prop, uid)
+        bound_uids = ()
+        if child is not None:
+            bound_uids = tuple(
+                owner.fbind(parent_prop, child.setter(child_prop))
+                for parent_prop, child_prop in bindings)
+
+    if child is not None:
+        for parent_prop, child_prop in bindings:
+            value = getattr(owner, parent_prop)
+            if getattr(child, child_prop, None) != value:
+                setattr(child, child_prop, value)
+    return bound_uids
+
+
 class MorphLeadingWidgetBehavior(EventDispatcher):
     """Behavior for managing a leading icon widget.
     
@@ -79,9 +132,10 @@ class MorphLeadingWidgetBehavior(EventDispatcher):
     def _get_leading_icon(self) -> str:
         """Get the leading icon name from the leading widget.
 
-        This method retrieves the icon name from the `leading_widget`.
-        If the `leading_widget` is None, it returns the internal
-        stored leading icon name.
+        This method returns the stored icon name while a `leading_widget`
+        is set and an empty string otherwise. The result is cached
+        by :attr:`leading_icon` and refreshed whenever the icon name is set
+        or the `leading_widget` is updated.
 
         Returns
         -------
@@ -90,13 +144,10 @@ class MorphLeadingWidgetBehavior(EventDispatcher):
         """
         if self.leading_widget is None:
             return ''
-        
-        if self.leading_widget.icon and not self._leading_icon:
-            self._leading_icon = self.leading_widget.icon
-    
+
         return self._leading_icon
     
-    def _set_leading_icon(self, icon_name: str) -> None:
+    def _set_leading_icon(self, icon_name: str) -> bool:
         """Set the leading icon name on the leading widget.
 
         This method sets the icon name on the `leading_widget`.
@@ -106,31 +157,41 @@ class MorphLeadingWidgetBehavior(EventDispatcher):
         ----------
         icon_name : str
             The name of the leading icon to set
+
+        Returns
+        -------
+        bool
+            True if the stored icon name changed, which lets the
+            alias property dispatch the change
         """
+        changed = icon_name != self._leading_icon
         self._leading_icon = icon_name
-        if self.leading_widget is not None:
-            self.leading_widget.icon = icon_name
+        leading_widget = self.leading_widget
+        if leading_widget is not None:
+            leading_widget.icon = icon_name
+        return changed
 
-    _leading_icon: str = StringProperty('')
+    _leading_icon: str = ''
     """Internal stored name of the leading icon displayed to the left."""
 
     leading_icon: str = AliasProperty(
         _get_leading_icon,
         _set_leading_icon,
-        bind=['leading_widget', '_leading_icon',])
+        cache=True,)
     """The name of the leading icon displayed to the left.
 
     This property gets/sets the `icon` property of the `leading_widget`.
     If the `leading_widget` supports scale animations, the icon change
     will be animated smoothly.
 
-    :attr:`leading_icon` is a :class:`~kivy.properties.AliasProperty`
-    and is bound to changes in the `leading_widget`.
+    :attr:`leading_icon` is a :class:`~kivy.properties.AliasProperty`.
+    It is re-synced by the update handler when `leading_widget`
+    changes.
     """
 
     shows_leading_icon: bool = AliasProperty(
         lambda self: _is_widget_visible(self.leading_widget),
-        bind=['leading_widget', '_leading_icon',])
+        bind=['leading_widget', 'leading_icon',])
     """Whether the leading icon is currently visible.
 
     This property returns True if the `leading_widget` is not None, has
@@ -212,6 +273,18 @@ class MorphLeadingWidgetBehavior(EventDispatcher):
     :class:`~morphui.uix.label.MorphLeadingIconLabel`.
     """
 
+    _leading_widget_bindings: Tuple[Tuple[str, str], ...] = (
+        ('leading_scale_enabled', 'scale_enabled'),
+        ('normal_leading_icon', 'normal_icon'),
+        ('disabled_leading_icon', 'disabled_icon'),
+        ('focus_leading_icon', 'focus_icon'),
+        ('active_leading_icon', 'active_icon'),)
+    """Pairs of parent and `leading_widget` property names kept in sync.
+
+    The values are pushed to the child in this order, so
+    `leading_scale_enabled` is applied before any icon changes.
+    """
+
     _bound_leading_widget: MorphLeadingIconLabel | None = None
     """The widget on which property bindings are currently active.
 
@@ -223,6 +296,14 @@ class MorphLeadingWidgetBehavior(EventDispatcher):
     be modified directly.
     """
 
+    _leading_binding_uids: Tuple[int, ...] = ()
+    """Uids of the bindings to :attr:`_bound_leading_widget`.
+
+    They are used to remove exactly these bindings when the
+    `leading_widget` is replaced, so the previous widget no longer
+    receives updates.
+    """
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         if self._leading_icon and not self.normal_leading_icon:
@@ -238,31 +319,17 @@ class MorphLeadingWidgetBehavior(EventDispatcher):
         the current state of the parent widget, including icon names
         and any other relevant properties.
         """
-        self.leading_icon = self._get_leading_icon()
-        if self.leading_widget is None:
-            return
-        
-        icons_to_bind = {
-            'normal_leading_icon': 'normal_icon',
-            'disabled_leading_icon': 'disabled_icon',
-            'focus_leading_icon': 'focus_icon',
-            'active_leading_icon': 'active_icon',
-            'leading_scale_enabled': 'scale_enabled',}
-
-        if leading_widget is not self._bound_leading_widget:
-            for icon_parent, icon_child in icons_to_bind.items():
-                if self._bound_leading_widget:
-                    self.unbind(**{
-                        icon_parent: self._bound_leading_widget.setter(icon_child)})
-                self.bind(
-                    **{icon_parent: self.leading_widget.setter(icon_child)})
-            self._bound_leading_widget = self.leading_widget
-
-        self.leading_widget.scale_enabled = self.leading_scale_enabled
-        self.leading_widget.normal_icon = self.normal_leading_icon
-        self.leading_widget.disabled_icon = self.disabled_leading_icon
-        self.leading_widget.focus_icon = self.focus_leading_icon
-        self.leading_widget.active_icon = self.active_leading_icon
+        if leading_widget is not None and not self._leading_icon:
+            self._leading_icon = leading_widget.icon
+        self.leading_icon = self._leading_icon
+        self.property('leading_icon').trigger_change(self, None)
+        self._leading_binding_uids = _delegate_to_child(
+            self,
+            leading_widget,
+            self._bound_leading_widget,
+            self._leading_binding_uids,
+            self._leading_widget_bindings)
+        self._bound_leading_widget = leading_widget
     
     def refresh_leading_widget(self) -> None:
         """Refresh the leading widget to reflect current properties.
@@ -294,9 +361,10 @@ class MorphLabelWidgetBehavior(EventDispatcher):
     def _get_label_text(self) -> str:
         """Get the text from the label widget.
 
-        This method retrieves the text from the `label_widget`.
-        If the `label_widget` is None, it returns the internal
-        stored label text.
+        This method returns the stored text while a `label_widget`
+        is set and an empty string otherwise. The result is cached
+        by :attr:`label_text` and refreshed whenever the text is set
+        or the `label_widget` is updated.
 
         Returns
         -------
@@ -305,13 +373,10 @@ class MorphLabelWidgetBehavior(EventDispatcher):
         """
         if self.label_widget is None:
             return ''
-        
-        if self.label_widget.text and not self._label_text:
-            self._label_text = self.label_widget.text
-        
+
         return self._label_text
     
-    def _set_label_text(self, text: str) -> None:
+    def _set_label_text(self, text: str) -> bool:
         """Set the text on the label widget.
 
         This method sets the text on the `label_widget`. It also updates
@@ -321,24 +386,34 @@ class MorphLabelWidgetBehavior(EventDispatcher):
         ----------
         text : str
             The text to set on the label
+
+        Returns
+        -------
+        bool
+            True if the stored text changed, which lets the
+            alias property dispatch the change
         """
+        changed = text != self._label_text
         self._label_text = text
-        if self.label_widget is not None:
-            self.label_widget.text = text
+        label_widget = self.label_widget
+        if label_widget is not None:
+            label_widget.text = text
+        return changed
 
-    _label_text: str = StringProperty('')
+    _label_text: str = ''
     """Internal stored text of the label displayed in the center."""
 
     label_text: str = AliasProperty(
         _get_label_text,
         _set_label_text,
-        bind=['label_widget', '_label_text'])
+        cache=True,)
     """The text displayed in the center.
 
     This property gets/sets the `text` property of the `label_widget`.
 
-    :attr:`label_text` is a :class:`~kivy.properties.AliasProperty`
-    and is bound to changes in the `label_widget`.
+    :attr:`label_text` is a :class:`~kivy.properties.AliasProperty`.
+    It is re-synced by the update handler when `label_widget`
+    changes.
     """
 
     label_widget: MorphTextLabel = ObjectProperty(None)
@@ -350,7 +425,7 @@ class MorphLabelWidgetBehavior(EventDispatcher):
 
     shows_label: bool = AliasProperty(
         lambda self: _is_widget_visible(self.label_widget),
-        bind=['label_widget', '_label_text'])
+        bind=['label_widget', 'label_text',])
     """Whether the label is currently visible.
 
     This property returns True if the `label_widget` is not None, has
@@ -378,7 +453,10 @@ class MorphLabelWidgetBehavior(EventDispatcher):
         the current state of the parent widget, including text content
         and any other relevant properties.
         """
-        self.label_text = self._get_label_text()
+        if label_widget is not None and not self._label_text:
+            self._label_text = label_widget.text
+        self.label_text = self._label_text
+        self.property('label_text').trigger_change(self, None)
 
     def refresh_label_widget(self) -> None:
         """Refresh the label widget to reflect current properties.
@@ -404,9 +482,10 @@ class MorphTripleLabelBehavior(EventDispatcher):
     def _get_heading_text(self) -> str:
         """Get the text from the heading label widget.
 
-        This method retrieves the text from the `heading_widget`.
-        If the `heading_widget` is None, it returns the internal
-        stored heading text.
+        This method returns the stored text while a `heading_widget`
+        is set and an empty string otherwise. The result is cached
+        by :attr:`heading_text` and refreshed whenever the text is set
+        or the `heading_widget` is updated.
 
         Returns
         -------
@@ -415,13 +494,10 @@ class MorphTripleLabelBehavior(EventDispatcher):
         """
         if self.heading_widget is None:
             return ''
-        
-        if self.heading_widget.text and not self._heading_text:
-            self._heading_text = self.heading_widget.text
-        
+
         return self._heading_text
     
-    def _set_heading_text(self, text: str) -> None:
+    def _set_heading_text(self, text: str) -> bool:
         """Set the text on the heading label widget.
 
         This method sets the text on the `heading_widget`. It also
@@ -431,24 +507,34 @@ class MorphTripleLabelBehavior(EventDispatcher):
         ----------
         text : str
             The heading text to set
+
+        Returns
+        -------
+        bool
+            True if the stored text changed, which lets the
+            alias property dispatch the change
         """
+        changed = text != self._heading_text
         self._heading_text = text
-        if self.heading_widget is not None:
-            self.heading_widget.text = text
+        heading_widget = self.heading_widget
+        if heading_widget is not None:
+            heading_widget.text = text
+        return changed
 
-    _heading_text: str = StringProperty('')
+    _heading_text: str = ''
     """Internal stored text of the heading label displayed at the top."""
 
     heading_text: str = AliasProperty(
         _get_heading_text,
         _set_heading_text,
-        bind=['heading_widget', '_heading_text'])
+        cache=True,)
     """The heading text displayed at the top.
 
     This property gets/sets the `text` property of the `heading_widget`.
 
-    :attr:`heading_text` is a :class:`~kivy.properties.AliasProperty`
-    and is bound to changes in the `heading_widget`.
+    :attr:`heading_text` is a :class:`~kivy.properties.AliasProperty`.
+    It is re-synced by the update handler when `heading_widget`
+    changes.
     """
 
     heading_widget: MorphTextLabel = ObjectProperty(None)
@@ -464,9 +550,10 @@ class MorphTripleLabelBehavior(EventDispatcher):
     def _get_supporting_text(self) -> str:
         """Get the text from the supporting label widget.
 
-        This method retrieves the text from the `supporting_widget`.
-        If the `supporting_widget` is None, it returns the internal
-        stored supporting text.
+        This method returns the stored text while a `supporting_widget`
+        is set and an empty string otherwise. The result is cached
+        by :attr:`supporting_text` and refreshed whenever the text is set
+        or the `supporting_widget` is updated.
 
         Returns
         -------
@@ -475,13 +562,10 @@ class MorphTripleLabelBehavior(EventDispatcher):
         """
         if self.supporting_widget is None:
             return ''
-        
-        if self.supporting_widget.text and not self._supporting_text:
-            self._supporting_text = self.supporting_widget.text
-        
+
         return self._supporting_text
     
-    def _set_supporting_text(self, text: str) -> None:
+    def _set_supporting_text(self, text: str) -> bool:
         """Set the text on the supporting label widget.
 
         This method sets the text on the `supporting_widget`. It also
@@ -491,26 +575,36 @@ class MorphTripleLabelBehavior(EventDispatcher):
         ----------
         text : str
             The supporting text to set
+
+        Returns
+        -------
+        bool
+            True if the stored text changed, which lets the
+            alias property dispatch the change
         """
+        changed = text != self._supporting_text
         self._supporting_text = text
-        if self.supporting_widget is not None:
-            self.supporting_widget.text = text
+        supporting_widget = self.supporting_widget
+        if supporting_widget is not None:
+            supporting_widget.text = text
+        return changed
 
-    _supporting_text: str = StringProperty('')
+    _supporting_text: str = ''
     """Internal stored text of the supporting label displayed in the
     center."""
 
     supporting_text: str = AliasProperty(
         _get_supporting_text,
         _set_supporting_text,
-        bind=['supporting_widget', '_supporting_text'])
+        cache=True,)
     """The supporting text displayed in the center.
 
     This property gets/sets the `text` property of the
     `supporting_widget`.
 
-    :attr:`supporting_text` is a :class:`~kivy.properties.AliasProperty`
-    and is bound to changes in the `supporting_widget`.
+    :attr:`supporting_text` is a :class:`~kivy.properties.AliasProperty`.
+    It is re-synced by the update handler when `supporting_widget`
+    changes.
     """
 
     supporting_widget: MorphTextLabel = ObjectProperty(None)
@@ -526,9 +620,10 @@ class MorphTripleLabelBehavior(EventDispatcher):
     def _get_tertiary_text(self) -> str:
         """Get the text from the tertiary label widget.
 
-        This method retrieves the text from the `tertiary_widget`.
-        If the `tertiary_widget` is None, it returns the internal
-        stored tertiary text.
+        This method returns the stored text while a `tertiary_widget`
+        is set and an empty string otherwise. The result is cached
+        by :attr:`tertiary_text` and refreshed whenever the text is set
+        or the `tertiary_widget` is updated.
 
         Returns
         -------
@@ -537,13 +632,10 @@ class MorphTripleLabelBehavior(EventDispatcher):
         """
         if self.tertiary_widget is None:
             return ''
-        
-        if self.tertiary_widget.text and not self._tertiary_text:
-            self._tertiary_text = self.tertiary_widget.text
-        
+
         return self._tertiary_text
     
-    def _set_tertiary_text(self, text: str) -> None:
+    def _set_tertiary_text(self, text: str) -> bool:
         """Set the text on the tertiary label widget.
 
         This method sets the text on the `tertiary_widget`. It also
@@ -553,26 +645,36 @@ class MorphTripleLabelBehavior(EventDispatcher):
         ----------
         text : str
             The tertiary text to set
+
+        Returns
+        -------
+        bool
+            True if the stored text changed, which lets the
+            alias property dispatch the change
         """
+        changed = text != self._tertiary_text
         self._tertiary_text = text
-        if self.tertiary_widget is not None:
-            self.tertiary_widget.text = text
+        tertiary_widget = self.tertiary_widget
+        if tertiary_widget is not None:
+            tertiary_widget.text = text
+        return changed
 
-    _tertiary_text: str = StringProperty('')
+    _tertiary_text: str = ''
     """Internal stored text of the tertiary label displayed at the
     bottom."""
 
     tertiary_text: str = AliasProperty(
         _get_tertiary_text,
         _set_tertiary_text,
-        bind=['tertiary_widget', '_tertiary_text'])
+        cache=True,)
     """The tertiary text displayed at the bottom.
 
     This property gets/sets the `text` property of the
     `tertiary_widget`.
 
-    :attr:`tertiary_text` is a :class:`~kivy.properties.AliasProperty`
-    and is bound to changes in the `tertiary_widget`.
+    :attr:`tertiary_text` is a :class:`~kivy.properties.AliasProperty`.
+    It is re-synced by the update handler when `tertiary_widget`
+    changes.
     """
 
     tertiary_widget: MorphTextLabel = ObjectProperty(None)
@@ -587,7 +689,7 @@ class MorphTripleLabelBehavior(EventDispatcher):
 
     shows_heading: bool = AliasProperty(
         lambda self: _is_widget_visible(self.heading_widget),
-        bind=['heading_widget', '_heading_text'])
+        bind=['heading_widget', 'heading_text',])
     """Whether the heading label is currently visible.
 
     This property returns True if the `heading_widget` is not None, has
@@ -601,7 +703,7 @@ class MorphTripleLabelBehavior(EventDispatcher):
 
     shows_supporting: bool = AliasProperty(
         lambda self: _is_widget_visible(self.supporting_widget),
-        bind=['supporting_widget', '_supporting_text'])
+        bind=['supporting_widget', 'supporting_text',])
     """Whether the supporting label is currently visible.
 
     This property returns True if the `supporting_widget` is not None, 
@@ -616,7 +718,7 @@ class MorphTripleLabelBehavior(EventDispatcher):
 
     shows_tertiary: bool = AliasProperty(
         lambda self: _is_widget_visible(self.tertiary_widget),
-        bind=['tertiary_widget', '_tertiary_text'])
+        bind=['tertiary_widget', 'tertiary_text',])
     """Whether the tertiary label is currently visible.
 
     This property returns True if the `tertiary_widget` is not None, has
@@ -628,44 +730,55 @@ class MorphTripleLabelBehavior(EventDispatcher):
     that is bound to changes in the `tertiary_widget` and its text.
     """
 
+    _triple_label_fields: Tuple[Tuple[str, str, str], ...] = (
+        ('heading_widget', '_heading_text', 'heading_text'),
+        ('supporting_widget', '_supporting_text', 'supporting_text'),
+        ('tertiary_widget', '_tertiary_text', 'tertiary_text'),)
+    """Property names of the three managed labels, from top to bottom.
+
+    Each entry holds the names of the `<prefix>_widget` property, the
+    internal `_<prefix>_text` field and the `<prefix>_text` alias. The
+    names are spelled out so the update handler does not format them
+    on every call.
+    """
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         
-        self.bind(
-            heading_widget=self._update_heading_widget,
-            supporting_widget=self._update_supporting_widget,
-            tertiary_widget=self._update_tertiary_widget,)
+        for widget_name, stored_name, text_name in self._triple_label_fields:
+            self.fbind(
+                widget_name, self._update_triple_label, stored_name, text_name)
         self.refresh_triple_labels()
 
-    def _update_heading_widget(
-            self, instance: Any, heading_widget: Any) -> None:
-        """Called when the heading widget is changed.
+    def _update_triple_label(
+            self,
+            stored_name: str,
+            text_name: str,
+            instance: Any,
+            widget: Any) -> None:
+        """Called when one of the three label widgets is changed.
 
-        This method updates the `heading_widget` to ensure it reflects
+        This method updates the given label widget to ensure it reflects
         the current state of the parent widget, including text content
-        and any other relevant properties.
-        """
-        self.heading_text = self._get_heading_text()
+        and any other relevant properties. If nothing was stored yet,
+        the text already shown by the widget is adopted.
 
-    def _update_supporting_widget(
-            self, instance: Any, supporting_widget: Any) -> None:
-        """Called when the supporting widget is changed.
-
-        This method updates the `supporting_widget` to ensure it
-        reflects the current state of the parent widget, including text
-        content and any other relevant properties.
-        """
-        self.supporting_text = self._get_supporting_text()
-
-    def _update_tertiary_widget(
-            self, instance: Any, tertiary_widget: Any) -> None:
-        """Called when the tertiary widget is changed.
-
-        This method updates the `tertiary_widget` to ensure it reflects
-        the current state of the parent widget, including text content
-        and any other relevant properties.
+        Parameters
+        ----------
+        stored_name : str
+            Name of the internal `_<prefix>_text` field, see
+            :attr:`_triple_label_fields`
+        text_name : str
+            Name of the `<prefix>_text` alias property
+        instance : Any
+            The widget that owns the label widget property
+        widget : Any
+            The new label widget, or None
         """
-        self.tertiary_text = self._get_tertiary_text()
+        if widget is not None and not getattr(self, stored_name):
+            setattr(self, stored_name, widget.text)
+        setattr(self, text_name, getattr(self, stored_name))
+        self.property(text_name).trigger_change(self, None)
 
     def refresh_triple_labels(self) -> None:
         """Refresh all three label widgets to reflect current properties.
@@ -673,16 +786,13 @@ class MorphTripleLabelBehavior(EventDispatcher):
         This method updates the `heading_widget`, `supporting_widget`,
         and `tertiary_widget` to ensure they reflect the current state
         of the parent widget, including text content and any other
-        relevant properties.
+        relevant properties. Widgets that are not set are skipped.
         """
-        self._update_heading_widget(self, self.heading_widget)
-        refresh_widget(self.heading_widget)
-
-        self._update_supporting_widget(self, self.supporting_widget)
-        refresh_widget(self.supporting_widget)
-
-        self._update_tertiary_widget(self, self.tertiary_widget)
-        refresh_widget(self.tertiary_widget)
+        for widget_name, stored_name, text_name in self._triple_label_fields:
+            widget = getattr(self, widget_name)
+            if widget is not None:
+                self._update_triple_label(stored_name, text_name, self, widget)
+                refresh_widget(widget)
 
 
 class MorphTrailingWidgetBehavior(EventDispatcher):
@@ -711,9 +821,10 @@ class MorphTrailingWidgetBehavior(EventDispatcher):
     def _get_trailing_icon(self) -> str:
         """Get the trailing icon name from the trailing widget.
 
-        This method retrieves the icon name from the `trailing_widget`.
-        If the `trailing_widget` is None, it returns the internal
-        stored trailing icon name.
+        This method returns the stored icon name while a `trailing_widget`
+        is set and an empty string otherwise. The result is cached
+        by :attr:`trailing_icon` and refreshed whenever the icon name is set
+        or the `trailing_widget` is updated.
 
         Returns
         -------
@@ -722,13 +833,10 @@ class MorphTrailingWidgetBehavior(EventDispatcher):
         """
         if self.trailing_widget is None:
             return ''
-        
-        if self.trailing_widget.icon and not self._trailing_icon:
-            self._trailing_icon = self.trailing_widget.icon
 
         return self._trailing_icon
     
-    def _set_trailing_icon(self, icon_name: str) -> None:
+    def _set_trailing_icon(self, icon_name: str) -> bool:
         """Set the trailing icon name on the trailing widget.
 
         This method sets the icon name on the `trailing_widget`.
@@ -738,26 +846,36 @@ class MorphTrailingWidgetBehavior(EventDispatcher):
         ----------
         icon_name : str
             The name of the trailing icon to set
+
+        Returns
+        -------
+        bool
+            True if the stored icon name changed, which lets the
+            alias property dispatch the change
         """
+        changed = icon_name != self._trailing_icon
         self._trailing_icon = icon_name
-        if self.trailing_widget is not None:
-            self.trailing_widget.icon = icon_name
+        trailing_widget = self.trailing_widget
+        if trailing_widget is not None:
+            trailing_widget.icon = icon_name
+        return changed
 
-    _trailing_icon: str = StringProperty('')
+    _trailing_icon: str = ''
     """Internal stored name of the trailing icon displayed to the right."""
 
     trailing_icon: str = AliasProperty(
         _get_trailing_icon,
         _set_trailing_icon,
-        bind=['trailing_widget', '_trailing_icon',])
+        cache=True,)
     """The name of the trailing icon displayed to the right.
 
     This property gets/sets the `icon` property of the `trailing_widget`.
     If the `trailing_widget` supports scale animations, the icon change
     will be animated smoothly.
 
-    :attr:`trailing_icon` is a :class:`~kivy.properties.AliasProperty`
-    and is bound to changes in the `trailing_widget`.
+    :attr:`trailing_icon` is a :class:`~kivy.properties.AliasProperty`.
+    It is re-synced by the update handler when `trailing_widget`
+    changes.
     """
 
     normal_trailing_icon: str = StringProperty('')
@@ -811,7 +929,7 @@ class MorphTrailingWidgetBehavior(EventDispatcher):
 
     shows_trailing_icon: bool = AliasProperty(
         lambda self: _is_widget_visible(self.trailing_widget),
-        bind=['trailing_widget', '_trailing_icon',])
+        bind=['trailing_widget', 'trailing_icon',])
     """Whether the trailing icon is currently visible.
 
     This property returns True if the `trailing_widget` is not None, has
@@ -842,6 +960,18 @@ class MorphTrailingWidgetBehavior(EventDispatcher):
     :class:`~morphui.uix.label.MorphTrailingIconLabel`.
     """
 
+    _trailing_widget_bindings: Tuple[Tuple[str, str], ...] = (
+        ('trailing_scale_enabled', 'scale_enabled'),
+        ('normal_trailing_icon', 'normal_icon'),
+        ('disabled_trailing_icon', 'disabled_icon'),
+        ('focus_trailing_icon', 'focus_icon'),
+        ('active_trailing_icon', 'active_icon'),)
+    """Pairs of parent and `trailing_widget` property names kept in sync.
+
+    The values are pushed to the child in this order, so
+    `trailing_scale_enabled` is applied before any icon changes.
+    """
+
     _bound_trailing_widget: MorphTrailingIconLabel | None = None
     """The widget on which property bindings are currently active.
 
@@ -853,6 +983,14 @@ class MorphTrailingWidgetBehavior(EventDispatcher):
     not be modified directly.
     """
 
+    _trailing_binding_uids: Tuple[int, ...] = ()
+    """Uids of the bindings to :attr:`_bound_trailing_widget`.
+
+    They are used to remove exactly these bindings when the
+    `trailing_widget` is replaced, so the previous widget no longer
+    receives updates.
+    """
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         if self._trailing_icon and not self.normal_trailing_icon:
@@ -869,31 +1007,17 @@ class MorphTrailingWidgetBehavior(EventDispatcher):
         the current state of the parent widget, including icon names
         and any other relevant properties.
         """
-        self.trailing_icon = self._get_trailing_icon()
-        if self.trailing_widget is None:
-            return
-        
-        icons_to_bind = {
-            'normal_trailing_icon': 'normal_icon',
-            'disabled_trailing_icon': 'disabled_icon',
-            'focus_trailing_icon': 'focus_icon',
-            'active_trailing_icon': 'active_icon',
-            'trailing_scale_enabled': 'scale_enabled',}
-        
-        if self.trailing_widget is not self._bound_trailing_widget:
-            for icon_parent, icon_child in icons_to_bind.items():
-                if self._bound_trailing_widget:
-                    self.unbind(**{
-                        icon_parent: self._bound_trailing_widget.setter(icon_child)})
-                self.bind(
-                    **{icon_parent: self.trailing_widget.setter(icon_child)})
-            self._bound_trailing_widget = self.trailing_widget
-        
-        self.trailing_widget.scale_enabled = self.trailing_scale_enabled
-        self.trailing_widget.normal_icon = self.normal_trailing_icon
-        self.trailing_widget.disabled_icon = self.disabled_trailing_icon
-        self.trailing_widget.focus_icon = self.focus_trailing_icon
-        self.trailing_widget.active_icon = self.active_trailing_icon
+        if trailing_widget is not None and not self._trailing_icon:
+            self._trailing_icon = trailing_widget.icon
+        self.trailing_icon = self._trailing_icon
+        self.property('trailing_icon').trigger_change(self, None)
+        self._trailing_binding_uids = _delegate_to_child(
+            self,
+            trailing_widget,
+            self._bound_trailing_widget,
+            self._trailing_binding_uids,
+            self._trailing_widget_bindings)
+        self._bound_trailing_widget = trailing_widget
 
     def refresh_trailing_widget(self) -> None:
         """Refresh the trailing widget to reflect current properties.
@@ -1,4 +1,6 @@
 from typing import Any
+from typing import Set
+from typing import List
 
 from kivy.uix.widget import Widget
 from kivy.properties import ListProperty
@@ -65,12 +67,14 @@ class MorphIdentificationBehavior:
     ```
     """
 
-    _identities: DotDict = ObjectProperty(DotDict())
+    _identities: DotDict = ObjectProperty(None)
     """Internal storage for the identities-to-widgets mapping.
     
     This private attribute stores the mapping between identity strings
     and their corresponding widget instances. It should not be accessed
-    directly - use the :attr:`identities` property instead.
+    directly - use the :attr:`identities` property instead. Each
+    instance gets its own mapping in :meth:`__init__`; there is no
+    shared default so mappings cannot leak between widgets.
     """
 
     def _get_identities(self) -> DotDict:
@@ -128,6 +132,10 @@ class MorphIdentificationBehavior:
     ```
     """
     
+    def __init__(self, **kwargs) -> None:
+        self._identities = DotDict()
+        super().__init__(**kwargs)
+
     def _register_declarative_child(self, widget: Any) -> None:
         """Register a child widget's identity for easy access.
         
@@ -136,8 +144,9 @@ class MorphIdentificationBehavior:
         attribute set, it will be added to the :attr:`identities` 
         mapping for easy reference.
         
-        The method ensures that existing identities are preserved when
-        updating the mapping to handle multiple inheritance scenarios.
+        Existing identities are preserved, so the first widget
+        registered under an identity keeps it. The mapping is updated in
+        place and :attr:`identities` is dispatched when it changes.
         
         Parameters
         ----------
@@ -151,16 +160,14 @@ class MorphIdentificationBehavior:
         It's automatically called by :meth:`add_widget` and similar 
         methods.
         """
-        # Always overwrite identities here to avoid class attribute
-        # conflicts in multiple inheritance scenarios!
         if hasattr(widget, 'identities'):
             for sub_widget in widget.identities.values():
                 self._register_declarative_child(sub_widget)
 
         identity = getattr(widget, 'identity', None)
-        if identity is not None and identity != '':
-            self.identities = DotDict(
-                {identity: widget} | {**self.identities})
+        if identity and identity not in self._identities:
+            self._identities[identity] = widget
+            self.property('identities').dispatch(self)
     
     def _unregister_declarative_child(self, widget: Any) -> None:
         """Unregister a child widget's identity from the identities 
@@ -170,8 +177,8 @@ class MorphIdentificationBehavior:
         this widget. If the child widget has an identity that exists in
         the :attr:`identities` mapping, it will be removed.
         
-        The method ensures that other identities are preserved when
-        updating the mapping to handle multiple inheritance scenarios.
+        The mapping is updated in place and :attr:`identities` is
+        dispatched when it changes.
 
         Parameters
         ----------
@@ -185,16 +192,14 @@ class MorphIdentificationBehavior:
         It's automatically called by :meth:`remove_widget` and similar 
         methods.
         """
-        # Always overwrite identities here to avoid class attribute
-        # conflicts in multiple inheritance scenarios!
         if hasattr(widget, '_identities'):
             for sub_widget in widget._identities.values():
                 self._unregister_declarative_child(sub_widget)
 
         identity = getattr(widget, 'identity', None)
         if identity and identity in self._identities:
-            self._identities = DotDict(
-                {k: v for k, v in self._identities.items() if k != identity})
+            del self._identities[identity]
+            self.property('identities').dispatch(self)
 
 
 class MorphDeclarativeBehavior(MorphIdentificationBehavior):
@@ -300,6 +305,23 @@ class MorphDeclarativeBehavior(MorphIdentificationBehavior):
     ```
     """
 
+    _declarative_children_set: Set[Widget] = frozenset()
+    """Membership index of :attr:`declarative_children`.
+
+    Rebuilt whenever :attr:`declarative_children` changes so that
+    :meth:`add_widget` and :meth:`remove_widget` can check membership
+    without scanning the list.
+    """
+
+    _syncing_declarative_children: bool = False
+    """Whether :meth:`add_widget` or :meth:`remove_widget` is currently
+    updating :attr:`declarative_children` in place.
+
+    While set, :meth:`_update_declarative_children` skips the tree
+    synchronization because the calling method handles the single
+    widget itself.
+    """
+
     def __init__(self, *widgets, **kwargs) -> None:
         """Initialize the declarative behavior.
         
@@ -327,10 +349,35 @@ class MorphDeclarativeBehavior(MorphIdentificationBehavior):
         )
         ```
         """
+        self._declarative_children_set = set()
         super().__init__(**kwargs)
         self.bind( # type: ignore
-            declarative_children=lambda _, children: self.add_widgets(*children))
-        self.declarative_children = list(widgets)
+            declarative_children=self._update_declarative_children)
+        if widgets:
+            self.declarative_children = list(widgets)
+        elif self.declarative_children:
+            self._update_declarative_children(self, self.declarative_children)
+
+    def _update_declarative_children(
+            self, instance: Any, children: List[Widget]) -> None:
+        """Called when :attr:`declarative_children` changes.
+
+        Rebuilds the membership index used by :meth:`add_widget` and
+        :meth:`remove_widget` and synchronizes the widget tree via
+        :meth:`add_widgets`.
+
+        Parameters
+        ----------
+        instance : Any
+            The widget whose declarative children changed.
+        children : list[Widget]
+            The new list of declarative children.
+        """
+        if self._syncing_declarative_children:
+            return
+        
+        self._declarative_children_set = set(children)
+        self.add_widgets(*children)
     
     def add_widget(self, widget: Widget, *args, **kwargs) -> None:
         """Add a widget as a child and register it declaratively.
@@ -359,13 +406,16 @@ class MorphDeclarativeBehavior(MorphIdentificationBehavior):
         Notes
         -----
         If the widget is not already in :attr:`declarative_children`,
-        it will be added to the list, which will trigger another call
-        to this method to actually add it to the widget tree.
+        it is appended to the list in place. The resulting property
+        dispatch does not re-enter this method.
         """
-        if widget not in self.declarative_children:
-            self.declarative_children = (
-                list(self.declarative_children) + [widget])
-            return # changing declarative_children will call add_widget again, so return here
+        if widget not in self._declarative_children_set:
+            self._declarative_children_set.add(widget)
+            self._syncing_declarative_children = True
+            try:
+                self.declarative_children.append(widget)
+            finally:
+                self._syncing_declarative_children = False
         
         super().add_widget(widget, *args, **kwargs) # type: ignore
         self._register_declarative_child(widget)
@@ -396,14 +446,17 @@ class MorphDeclarativeBehavior(MorphIdentificationBehavior):
             
         Notes
         -----
-        If the widget is in :attr:`declarative_children`, it will be
-        removed from the list, which will trigger another call to this
-        method to actually remove it from the widget tree.
+        If the widget is in :attr:`declarative_children`, it is removed
+        from the list in place. The resulting property dispatch does
+        not re-enter this method.
         """
-        if widget in self.declarative_children:
-            self.declarative_children = [
-                w for w in self.declarative_children if w != widget]
-            return # changing declarative_children will call remove_widget again, so return here
+        if widget in self._declarative_children_set:
+            self._declarative_children_set.discard(widget)
+            self._syncing_declarative_children = True
+            try:
+                self.declarative_children.remove(widget)
+            finally:
+                self._syncing_declarative_children = False
         
         super().remove_widget(widget, *args, **kwargs) # type: ignore
         self._unregister_declarative_child(widget)
@@ -437,12 +490,16 @@ class MorphDeclarativeBehavior(MorphIdentificationBehavior):
         when :attr:`declarative_children` changes. You typically don't 
         need to call this method directly.
         """
-        current_children = list(getattr(self, 'children', []))
+        current_children = getattr(self, 'children', [])
+        current_set = set(current_children)
+        children_set = set(children)
+        to_remove = [c for c in current_children if c not in children_set]
+        to_add = [c for c in children if c not in current_set]
 
-        for child in current_children:
-            if child not in children:
-                self.remove_widget(child)
+        remove_widget = self.remove_widget
+        for child in to_remove:
+            remove_widget(child)
         
-        for child in children:
-            if child not in current_children:
-                self.add_widget(child)
+        add_widget = self.add_widget
+        for child in to_add:
+            add_widget(child)
@@ -4,10 +4,12 @@ from kivy.event import EventDispatcher
 from kivy.metrics import dp
 from kivy.graphics import Color
 from kivy.graphics import BoxShadow
-from kivy.properties import ListProperty
+from kivy.graphics import InstructionGroup
 from kivy.properties import ColorProperty
 from kivy.properties import AliasProperty
 from kivy.properties import BooleanProperty
+from kivy.properties import NumericProperty
+from kivy.properties import ReferenceListProperty
 from kivy.properties import BoundedNumericProperty
 
 
@@ -60,7 +62,20 @@ class MorphElevationBehavior(EventDispatcher):
     :attr:`shadow_inset` is a :class:`~kivy.properties.BooleanProperty`
     and defaults to `False` (outset)."""
 
-    shadow_offset: List[float] = ListProperty([2, -2], length=2)
+    shadow_offset_x: float = NumericProperty(2)
+    """Horizontal offset of the shadow.
+
+    :attr:`shadow_offset_x` is a :class:`~kivy.properties.NumericProperty`
+    and defaults to `2`."""
+
+    shadow_offset_y: float = NumericProperty(-2)
+    """Vertical offset of the shadow.
+
+    :attr:`shadow_offset_y` is a :class:`~kivy.properties.NumericProperty`
+    and defaults to `-2`."""
+
+    shadow_offset: List[float] = ReferenceListProperty(
+        shadow_offset_x, shadow_offset_y)
     """Offset of the shadow in the x and y directions.
 
     Specifies shadow offsets in (horizontal, vertical) format. Positive
@@ -68,8 +83,10 @@ class MorphElevationBehavior(EventDispatcher):
     right and/or top. The negative ones indicate that the shadow should 
     move to the left and/or down.
 
-    :attr:`shadow_offset` is a :class:`~kivy.properties.ListProperty`
-    and defaults to `[1, -1]`."""
+    :attr:`shadow_offset` is a 
+    :class:`~kivy.properties.ReferenceListProperty` of
+    (:attr:`shadow_offset_x`, :attr:`shadow_offset_y`) and defaults to
+    `[2, -2]`."""
 
     shadow_blur_factor: int = BoundedNumericProperty(
         4, min=1, max=7, val_type=int, errorhandler=lambda x: max(1, min(x, 7)))
@@ -88,7 +105,8 @@ class MorphElevationBehavior(EventDispatcher):
         None,
         bind=[
             'elevation',
-            'shadow_blur_factor'])
+            'shadow_blur_factor'],
+        cache=True)
     """Calculate blur radius based on elevation (read-only).
 
     The blur radius is determined by multiplying the :attr:`elevation` 
@@ -108,7 +126,35 @@ class MorphElevationBehavior(EventDispatcher):
     and defaults to `[0, 0, 0, 0.65]`.
     """
 
-    shadow_border_radius: List[float] = ListProperty([0, 0, 0, 0], length=4)
+    shadow_radius_top_left: float = NumericProperty(0)
+    """Border radius of the top-left shadow corner.
+
+    :attr:`shadow_radius_top_left` is a 
+    :class:`~kivy.properties.NumericProperty` and defaults to `0`."""
+
+    shadow_radius_top_right: float = NumericProperty(0)
+    """Border radius of the top-right shadow corner.
+
+    :attr:`shadow_radius_top_right` is a 
+    :class:`~kivy.properties.NumericProperty` and defaults to `0`."""
+
+    shadow_radius_bottom_right: float = NumericProperty(0)
+    """Border radius of the bottom-right shadow corner.
+
+    :attr:`shadow_radius_bottom_right` is a 
+    :class:`~kivy.properties.NumericProperty` and defaults to `0`."""
+
+    shadow_radius_bottom_left: float = NumericProperty(0)
+    """Border radius of the bottom-left shadow corner.
+
+    :attr:`shadow_radius_bottom_left` is a 
+    :class:`~kivy.properties.NumericProperty` and defaults to `0`."""
+
+    shadow_border_radius: List[float] = ReferenceListProperty(
+        shadow_radius_top_left,
+        shadow_radius_top_right,
+        shadow_radius_bottom_right,
+        shadow_radius_bottom_left)
     """Border radius for the shadow corners.
 
     The order of the corners is: top-left, top-right, bottom-right,
@@ -116,47 +162,114 @@ class MorphElevationBehavior(EventDispatcher):
     `MorphSurfaceLayerBehavior`), that value will be used instead.
 
     :attr:`shadow_border_radius` is a
-    :class:`~kivy.properties.ListProperty` and defaults to 
-    `[0, 0, 0, 0]`."""
+    :class:`~kivy.properties.ReferenceListProperty` of the four
+    `shadow_radius_*` properties and defaults to `[0, 0, 0, 0]`."""
+
+    _shadow_group: InstructionGroup
+    """Kivy InstructionGroup reserving the place of the shadow in
+    `canvas.before`.
+
+    Added when the widget is built, so the shadow keeps its position
+    relative to the other instructions of the widget, even though the
+    shadow instructions themselves are created later."""
+
+    _shadow_color_instruction: Color | None = None
+    """Kivy Color instruction for the shadow color.
+    
+    Created together with :attr:`_shadow_instruction` the first time
+    the widget gets an elevation of 1 or higher."""
 
-    _shadow_color_instruction: Color
-    """Kivy Color instruction for the shadow color."""
+    _shadow_instruction: BoxShadow | None = None
+    """Kivy BoxShadow instruction for the shadow effect.
+    
+    Widgets that are never elevated do not get shadow instructions in
+    their canvas at all."""
 
-    _shadow_instruction: BoxShadow
-    """Kivy BoxShadow instruction for the shadow effect."""
+    _has_radius: bool | None = None
+    """Whether the widget class has a `radius` property, resolved
+    per class on first instantiation (see :meth:`_class_has_radius`)."""
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         
-        group = NAME.SHADOW
-        with self.canvas.before:
-            self._shadow_color_instruction = Color(
-                rgba=self.shadow_color,
-                group=group)
-            self._shadow_instruction = BoxShadow(
-                group=group,
-                **self.shadow_params)
-        
-        self.bind(
-            pos=self._update_elevation,
-            size=self._update_elevation,
-            shadow_color=self._update_elevation,
-            shadow_offset=self._update_elevation,
-            shadow_inset=self._update_elevation,
-            shadow_blur_radius=self._update_elevation,
-            shadow_border_radius=self._update_elevation,)
-        if hasattr(self, 'radius'):
-            self.bind(radius=self.setter('shadow_border_radius'))
+        self._shadow_group = InstructionGroup(group=NAME.SHADOW)
+        self.canvas.before.add(self._shadow_group)
+        for name in (
+                'pos',
+                'size',
+                'shadow_color',
+                'shadow_offset',
+                'shadow_inset',
+                'shadow_blur_radius',
+                'shadow_border_radius',):
+            self.fbind(name, self._update_elevation)
+        if self._class_has_radius():
+            self.fbind('radius', self.setter('shadow_border_radius'))
             self.shadow_border_radius = self.radius
         self.refresh_elevation()
 
+    @classmethod
+    def _class_has_radius(cls) -> bool:
+        """Check whether the widget class provides a `radius` property.
+
+        The result is stored per class, so the attribute lookup is only
+        done for the first instance of each class. The cache is read
+        from the class' own namespace, so subclasses that add a
+        `radius` do not inherit the result of their base class.
+        """
+        has_radius = cls.__dict__.get('_has_radius')
+        if has_radius is None:
+            has_radius = hasattr(cls, 'radius')
+            cls._has_radius = has_radius
+        return has_radius
+
     def _update_elevation(self, *args) -> None:
-        """Update the shadow based on current elevation and properties."""
-        rgba = [0, 0, 0, 0] if self.elevation < 1 else self.shadow_color
-        self._shadow_color_instruction.rgba = rgba
-        for key, value in self.shadow_params.items():
-            setattr(self._shadow_instruction, key, value)   
+        """Update the shadow based on current elevation and properties.
+
+        The instructions are written directly instead of going through
+        :attr:`shadow_params`, since this runs on every position and
+        size change of the widget.
+        """
+        shadow = self._shadow_instruction
+        if self.elevation < 1:
+            if shadow is None:
+                return
+            self._shadow_color_instruction.rgba = [0, 0, 0, 0]
+            shadow.offset = [0, 0]
+            shadow.blur_radius = 0
+        else:
+            if shadow is None:
+                shadow = self._create_shadow_instructions()
+            self._shadow_color_instruction.rgba = self.shadow_color
+            shadow.offset = self.shadow_offset
+            shadow.blur_radius = self.shadow_blur_radius
+        shadow.inset = self.shadow_inset
+        shadow.size = self.size
+        shadow.pos = self.pos
+        shadow.border_radius = self.shadow_border_radius
     
+    def _create_shadow_instructions(self) -> BoxShadow:
+        """Create the shadow instructions in :attr:`_shadow_group`.
+
+        The group was added to `canvas.before` when the widget was
+        built, so the shadow is drawn at the same place in the canvas
+        as if it had been created right away, e.g. inside a stencil or
+        scale applied by other behaviors.
+
+        Returns
+        -------
+        BoxShadow
+            The newly created shadow instruction.
+        """
+        group = NAME.SHADOW
+        self._shadow_color_instruction = Color(
+            rgba=self.shadow_color,
+            group=group)
+        self._shadow_instruction = BoxShadow(group=group)
+        self._shadow_group.add(self._shadow_color_instruction)
+        self._shadow_group.add(self._shadow_instruction)
+        return self._shadow_instruction
+
     def refresh_elevation(self) -> None:
         """Manually refresh the elevation and shadow effect.
 
@@ -11,10 +11,13 @@ Choose the appropriate behavior based on your needs:
 """
 
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Tuple
 from typing import Literal
+from weakref import ref
 
+from kivy.clock import Clock
 from kivy.event import EventDispatcher
 from kivy.metrics import dp
 from kivy.properties import ListProperty
@@ -32,6 +35,76 @@ __all__ = [
     'MorphHoverEnhancedBehavior']
 
 
+class _HoverRegistry:
+    """Single Window `mouse_pos` listener shared by all hover widgets.
+
+    Instead of every widget binding its own callback to the Window,
+    widgets register here and the registry forwards mouse moves to
+    them. Widgets are held by weak references, in registration order,
+    and the Window binding only exists while at least one widget is
+    registered.
+
+    Mouse moves are coalesced: the registry only remembers the latest
+    position and forwards it once per frame, since mice can report
+    positions far more often than the screen is redrawn.
+    """
+
+    def __init__(self) -> None:
+        self._widgets: Dict[int, ref] = {}
+        self._uid: int = 0
+        self._pending: Tuple[Any, Tuple[float, float]] | None = None
+        self._trigger_flush = Clock.create_trigger(self._flush, 0)
+
+    def register(self, widget: 'MorphHoverBehavior') -> None:
+        """Start forwarding mouse moves to the given widget."""
+        key = id(widget)
+        if key in self._widgets:
+            return
+
+        self._widgets[key] = ref(widget, lambda _, key=key: self._remove(key))
+        if not self._uid:
+            self._uid = Window.fbind('mouse_pos', self._dispatch)
+
+    def unregister(self, widget: 'MorphHoverBehavior') -> None:
+        """Stop forwarding mouse moves to the given widget."""
+        self._remove(id(widget))
+
+    def _remove(self, key: int) -> None:
+        """Drop a registry entry and release the Window binding once
+        no widget is left."""
+        self._widgets.pop(key, None)
+        if not self._widgets and self._uid:
+            Window.unbind_uid('mouse_pos', self._uid)
+            self._uid = 0
+
+    def _dispatch(self, instance: Any, pos: Tuple[float, float]) -> None:
+        """Remember the latest mouse position and schedule a flush
+        for the next frame."""
+        self._pending = (instance, pos)
+        self._trigger_flush()
+
+    def _flush(self, *args) -> None:
+        """Forward the latest mouse position to every registered
+        widget.
+
+        Iterates over a snapshot, since handlers may register or
+        unregister widgets while the event is being dispatched.
+        """
+        if self._pending is None:
+            return
+
+        instance, pos = self._pending
+        self._pending = None
+        for widget_ref in tuple(self._widgets.values()):
+            widget = widget_ref()
+            if widget is not None:
+                widget.on_mouse_pos(instance, pos)
+
+
+_hover_registry = _HoverRegistry()
+"""Registry instance used by all :class:`MorphHoverBehavior` widgets."""
+
+
 class MorphHoverBehavior(EventDispatcher):
     """Basic hover behavior that detects mouse enter and leave events.
     
@@ -130,7 +203,23 @@ class MorphHoverBehavior(EventDispatcher):
         self.leave_pos: Tuple[float, float] = (0, 0)
         self.current_pos: Tuple[float, float] = (0, 0)
         
-        Window.bind(mouse_pos=self.on_mouse_pos)
+        self.fbind('hover_enabled', self._update_mouse_pos_binding)
+        self.fbind('parent', self._update_mouse_pos_binding)
+        self._update_mouse_pos_binding()
+
+    def _update_mouse_pos_binding(self, *args) -> None:
+        """Receive mouse moves only while hover is enabled and the
+        widget has a parent.
+
+        Registration goes through the shared :class:`_HoverRegistry`,
+        so there is a single Window `mouse_pos` binding regardless of
+        how many hover widgets exist. Disabled or detached widgets are
+        not called on mouse moves at all.
+        """
+        if self.hover_enabled and self.parent is not None:
+            _hover_registry.register(self)
+        else:
+            _hover_registry.unregister(self)
 
     @property
     def is_displayed(self) -> bool:
@@ -151,18 +240,23 @@ class MorphHoverBehavior(EventDispatcher):
         pos : Tuple[float, float]
             Mouse position in window coordinates
         """
-        if not self.is_displayed or not self.hover_enabled:
+        if not self.hover_enabled:
             return
 
-        self.current_pos = self.to_window(*pos)
-        inside = self.collide_point(*calculate_widget_local_pos(self, pos))
+        current_pos = calculate_widget_local_pos(self, pos)
+        inside = self.collide_point(*current_pos)
+        # The root window lookup walks the whole parent chain, so it is
+        # only done when the hover state could actually change
+        if (inside or self.hovered) and not self.is_displayed:
+            return
 
+        self.current_pos = current_pos
         if inside and not self.hovered:
-            self.enter_pos = self.current_pos
+            self.enter_pos = current_pos
             self.hovered = True
             self.dispatch('on_enter')
         elif not inside and self.hovered:
-            self.leave_pos = self.current_pos
+            self.leave_pos = current_pos
             self.hovered = False
             self.dispatch('on_leave')
 
@@ -314,7 +408,8 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
     
     Determines how many pixels from the widget edge count as "edge area"
     for hover detection. Larger values make edges easier to target but
-    reduce the center area.
+    reduce the center area. Set it to 0 to turn off edge and corner
+    detection and keep only the basic hover behavior.
 
     :attr:`edge_detection_size` is a :class:`~kivy.properties.NumericProperty`
     and defaults to 4.
@@ -323,6 +418,34 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
     _last_hovered_corner: str | None = None
     """Internal tracking of last hovered corner for event dispatching."""
 
+    _last_edge_mask: int = 0
+    """Edge bitmask of the last edge detection, used to skip property
+    writes while the pointer stays on the same edges."""
+
+    _edge_hovered_names: Tuple[Tuple[str, str], ...] = tuple(
+        (edge, f'{edge}_edge_hovered') for edge in NAME.EDGES)
+    """Pairs of edge name and the name of its hover state property,
+    built once so the names are not formatted on every mouse move."""
+
+    _corner_by_edges: Dict[Tuple[str, ...], str] = {
+        edges: corner
+        for corner in NAME.CORNERS
+        for edges in (
+            tuple(corner.split(NAME.SEP_CORNER)),
+            tuple(reversed(corner.split(NAME.SEP_CORNER))))}
+    """Corner names keyed by their two edges, in either order."""
+
+    _edges_by_mask: Tuple[Tuple[str, ...], ...] = tuple(
+        tuple(edge for bit, edge in enumerate(NAME.EDGES) if mask >> bit & 1)
+        for mask in range(1 << len(NAME.EDGES)))
+    """Hovered edges for every combination of edge states. The index
+    is a bitmask with one bit per edge, in the order of NAME.EDGES."""
+
+    _corner_by_mask: Tuple[str | None, ...] = tuple(
+        map(_corner_by_edges.get, _edges_by_mask))
+    """Hovered corner for every edge bitmask, None where the edges
+    do not form a corner."""
+
     __events__ = (
         'on_enter_edge',
         'on_leave_edge',
@@ -331,6 +454,8 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
+        for edge, name in self._edge_hovered_names:
+            self.fbind(name, self._dispatch_edge_event, edge)
 
     def get_hovered_corner(self) -> str | None:
         """Determine corner from currently hovered edges.
@@ -344,10 +469,7 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
         if not self.hovered or len(self.hovered_edges) != 2:
             return None
 
-        corner = NAME.SEP_CORNER.join(self.hovered_edges)
-        if corner not in NAME.CORNERS:
-            corner = NAME.SEP_CORNER.join(reversed(self.hovered_edges))
-        return corner if corner in NAME.CORNERS else None
+        return self._corner_by_edges.get(tuple(self.hovered_edges))
 
     def get_hovered_edges(self) -> List[str]:
         """Get list of currently hovered edges.
@@ -357,8 +479,12 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
         List[str]
             List of edge names that are currently hovered.
         """
-        return [
-            name for name in NAME.EDGES if getattr(self, f'{name}_edge_hovered')]
+        mask = (
+            self.left_edge_hovered
+            | self.top_edge_hovered << 1
+            | self.right_edge_hovered << 2
+            | self.bottom_edge_hovered << 3)
+        return list(self._edges_by_mask[mask])
 
     def on_mouse_pos(self, instance: Any, pos: Tuple[float, float]) -> None:
         """Enhanced mouse position handling with edge detection.
@@ -375,32 +501,59 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
         """
         # Call parent method for basic hover detection
         super().on_mouse_pos(instance, pos)
+
+        # Outside the widget with nothing left to clear is the common
+        # case, so leave before looking up the root window again. The
+        # same applies when edge detection is turned off
+        if not self.hovered_edges and (
+                not self.hovered or self.edge_detection_size <= 0):
+            return
         
-        if not self.is_displayed or not self.hover_enabled:
+        if not self.hover_enabled or not self.is_displayed:
             return
 
         # Only calculate edges if we're hovering over the widget
-        if self.hovered:
+        if self.hovered and self.edge_detection_size > 0:
             self._update_edge_detection()
         else:
             self._clear_edge_detection()
 
     def _update_edge_detection(self) -> None:
         """Update edge and corner detection based on current mouse position."""
-        # Calculate relative position within widget
-        x = self.current_pos[0] - self.x
-        y = self.current_pos[1] - self.y
-
-        # Update individual edge states
-        self.left_edge_hovered = (x <= self.edge_detection_size)
-        self.right_edge_hovered = (x >= self.width - self.edge_detection_size)
-        self.top_edge_hovered = (y >= self.height - self.edge_detection_size)
-        self.bottom_edge_hovered = (y <= self.edge_detection_size)
-
-        # Update edge list and corner detection
-        self.hovered_edges = self.get_hovered_edges()
+        # Calculate relative position within widget, reading each
+        # property only once
+        cx, cy = self.current_pos
+        px, py = self.pos
+        width, height = self.size
+        size = self.edge_detection_size
+        x = cx - px
+        y = cy - py
+
+        # Deep inside the widget no edge can be hovered, so only clear
+        # a previous edge state instead of writing every property
+        if size < x < width - size and size < y < height - size:
+            if self.hovered_edges:
+                self._clear_edge_detection()
+            return
+
+        # Compute all edge states at once, in the order of NAME.EDGES,
+        # and pack them into a bitmask for the lookup tables
+        left = x <= size
+        top = y >= height - size
+        right = x >= width - size
+        bottom = y <= size
+        mask = left | top << 1 | right << 2 | bottom << 3
+        if mask == self._last_edge_mask:
+            return
+
+        self._last_edge_mask = mask
+        self.left_edge_hovered = left
+        self.top_edge_hovered = top
+        self.right_edge_hovered = right
+        self.bottom_edge_hovered = bottom
+        self.hovered_edges = list(self._edges_by_mask[mask])
         self._last_hovered_corner = self.hovered_corner
-        self.hovered_corner = self.get_hovered_corner()
+        self.hovered_corner = self._corner_by_mask[mask]
 
     def _clear_edge_detection(self) -> None:
         """Clear all edge and corner detection when not hovering."""
@@ -408,17 +561,24 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
         self.right_edge_hovered = False
         self.top_edge_hovered = False
         self.bottom_edge_hovered = False
+        self._last_edge_mask = 0
         self.hovered_edges = []
         self._last_hovered_corner = self.hovered_corner
         self.hovered_corner = None
 
-    def _dispatch_edge_event(self, edge: str, hovered: bool) -> None:
+    def _dispatch_edge_event(
+            self, edge: str, instance: Any, hovered: bool) -> None:
         """Dispatch appropriate edge event based on hover state.
+
+        Bound to all four ``<edge>_edge_hovered`` properties in
+        :meth:`__init__`, so a single handler serves every edge.
         
         Parameters
         ----------
         edge : str
             Edge name ('left', 'right', 'top', 'bottom')
+        instance : Any
+            The widget instance
         hovered : bool
             Whether the edge is now hovered or not
         """
@@ -427,40 +587,46 @@ class MorphHoverEnhancedBehavior(MorphHoverBehavior):
         else:
             self.dispatch('on_leave_edge', edge)
 
-    # Edge event handlers
+    # Edge event handlers. Kept as no-op hooks for subclasses, the
+    # enter/leave edge events are dispatched by _dispatch_edge_event.
     def on_left_edge_hovered(self, instance: Any, hovered: bool) -> None:
         """Handle left edge hover state changes."""
-        self._dispatch_edge_event('left', hovered)
+        pass
 
     def on_right_edge_hovered(self, instance: Any, hovered: bool) -> None:
         """Handle right edge hover state changes."""
-        self._dispatch_edge_event('right', hovered)
+        pass
 
     def on_top_edge_hovered(self, instance: Any, hovered: bool) -> None:
         """Handle top edge hover state changes."""
-        self._dispatch_edge_event('top', hovered)
+        pass
 
     def on_bottom_edge_hovered(self, instance: Any, hovered: bool) -> None:
         """Handle bottom edge hover state changes."""
-        self._dispatch_edge_event('bottom', hovered)
+        pass
 
-    def on_hovered_corner(self, instance: Any, corner: str) -> None:
+    def on_hovered_corner(self, instance: Any, corner: str | None) -> None:
         """Handle corner hover state changes.
         
         Dispatches enter/leave corner events when the corner changes.
+        No leave event is dispatched when coming from no corner and no
+        enter event when moving to no corner.
         
         Parameters
         ----------
         instance : Any
             The widget instance
-        corner : str
-            New corner value
+        corner : str | None
+            New corner value, None if no corner is hovered
         """
-        if corner != self._last_hovered_corner:
-            if self._last_hovered_corner != 'none':
-                self.dispatch('on_leave_corner', self._last_hovered_corner)
-            if corner != 'none':
-                self.dispatch('on_enter_corner', corner)
+        last_corner = self._last_hovered_corner
+        if corner == last_corner:
+            return
+
+        if last_corner is not None:
+            self.dispatch('on_leave_corner', last_corner)
+        if corner is not None:
+            self.dispatch('on_enter_corner', corner)
 
     def on_enter_edge(
             self, edge: Literal['left', 'right', 'top', 'bottom']) -> None:
@@ -90,6 +90,27 @@ class MorphIconBehavior(
     Default order is ('disabled', 'focus', 'active', 'normal').
     """
 
+    _icon_has_text: bool | None = None
+    """Whether the widget has a `text` attribute to display the icon
+    character in. Resolved on the first icon assignment (see
+    :meth:`_resolve_icon_capabilities`)."""
+
+    _icon_scales: bool = False
+    """Whether icon changes are animated through
+    :class:`~morphui.uix.behaviors.MorphScaleBehavior`. Resolved
+    together with :attr:`_icon_has_text`."""
+
+    def _resolve_icon_capabilities(self) -> None:
+        """Resolve which optional features the widget provides for
+        displaying icons.
+
+        The checks are done once per instance instead of on every icon
+        change. They are not done at class level, since widgets may
+        provide `text` as a plain instance attribute.
+        """
+        self._icon_has_text = hasattr(self, 'text')
+        self._icon_scales = isinstance(self, MorphScaleBehavior)
+
     def _get_icon(self) -> str:
         """Get the current icon based on the current state.
 
@@ -103,9 +124,10 @@ class MorphIconBehavior(
             The icon name corresponding to the current state.
         """
         for state in self.icon_state_precedence:
-            value = getattr(self, state, False)
+            if not getattr(self, state, False):
+                continue
             icon = getattr(self, f'{state}_icon', None)
-            if value and icon:
+            if icon:
                 return icon
         return self.normal_icon
     
@@ -120,7 +142,9 @@ class MorphIconBehavior(
         icon : str
             The icon name to set.
         """
-        if not hasattr(self, 'text'):
+        if self._icon_has_text is None:
+            self._resolve_icon_capabilities()
+        if not self._icon_has_text:
             return
         
         def _set_text(self, text: str) -> None:
@@ -129,7 +153,7 @@ class MorphIconBehavior(
         if icon and not (self.normal_icon or self.active_icon):
             self.normal_icon = icon
 
-        if getattr(self, 'typography', None) is None:
+        if self.typography is None:
             text = icon
         elif icon == '':
             text = ''
@@ -141,7 +165,7 @@ class MorphIconBehavior(
         if self.text == text:
             return
 
-        if issubclass(type(self), MorphScaleBehavior) and self.scale_enabled:
+        if self._icon_scales and self.scale_enabled:
             if text:
                 _set_text(self, text)
                 self.animate_scale_in()
@@ -224,14 +248,15 @@ class MorphIconBehavior(
     def __init__(self, **kwargs) -> None:
         icon = kwargs.pop('icon', '')
         super().__init__(**kwargs)
-        self.bind(
-            disabled=self._update_icon,
-            active=self._update_icon,
-            focus=self._update_icon,
-            disabled_icon=self._update_icon,
-            focus_icon=self._update_icon,
-            active_icon=self._update_icon,
-            normal_icon=self._update_icon,)
+        for name in (
+                'disabled',
+                'active',
+                'focus',
+                'disabled_icon',
+                'focus_icon',
+                'active_icon',
+                'normal_icon',):
+            self.fbind(name, self._update_icon)
         if icon:
             self._set_icon(icon)
         else:
@@ -1,6 +1,8 @@
 from typing import Any
 from typing import List
 from typing import Dict
+from typing import Tuple
+from weakref import ref
 
 from kivy.clock import Clock
 from kivy.event import EventDispatcher
@@ -20,13 +22,92 @@ __all__ = [
     'MorphTabNavigableBehavior',]
 
 
+class _KeyPressRegistry:
+    """Single Window key listener shared by all key press widgets.
+
+    Instead of every widget binding its own callbacks to the Window's
+    `on_key_down` and `on_key_up` events, widgets register here and the
+    registry forwards each key event to them. Widgets are held by weak
+    references and are called in reverse registration order, the same
+    order Kivy uses for its own event observers. The Window bindings
+    only exist while at least one widget is registered.
+    """
+
+    def __init__(self) -> None:
+        self._widgets: Dict[int, ref] = {}
+        self._key_down_uid: int = 0
+        self._key_up_uid: int = 0
+
+    def register(self, widget: 'MorphKeyPressBehavior') -> None:
+        """Start forwarding key events to the given widget."""
+        key = id(widget)
+        if key in self._widgets:
+            return
+
+        self._widgets[key] = ref(widget, lambda _, key=key: self._remove(key))
+        if not self._key_down_uid:
+            self._key_down_uid = Window.fbind('on_key_down', self._key_down)
+            self._key_up_uid = Window.fbind('on_key_up', self._key_up)
+
+    def unregister(self, widget: 'MorphKeyPressBehavior') -> None:
+        """Stop forwarding key events to the given widget."""
+        self._remove(id(widget))
+
+    def _remove(self, key: int) -> None:
+        """Drop a registry entry and release the Window bindings once
+        no widget is left."""
+        self._widgets.pop(key, None)
+        if not self._widgets and self._key_down_uid:
+            Window.unbind_uid('on_key_down', self._key_down_uid)
+            Window.unbind_uid('on_key_up', self._key_up_uid)
+            self._key_down_uid = 0
+            self._key_up_uid = 0
+
+    def _live_widgets(self) -> List['MorphKeyPressBehavior']:
+        """Return a snapshot of the registered widgets that are still
+        alive, most recently registered first.
+
+        A snapshot is used since handlers may register or unregister
+        widgets while a key event is being dispatched.
+        """
+        widgets = []
+        for widget_ref in reversed(self._widgets.values()):
+            widget = widget_ref()
+            if widget is not None:
+                widgets.append(widget)
+        return widgets
+
+    def _key_down(self, instance: Any, *args) -> None:
+        """Forward a Window `on_key_down` event to all widgets."""
+        for widget in self._live_widgets():
+            widget.on_key_press(instance, *args)
+
+    def _key_up(self, instance: Any, *args) -> None:
+        """Forward a Window `on_key_up` event to all widgets."""
+        for widget in self._live_widgets():
+            widget.on_key_release(instance, *args)
+
+
+_key_press_registry = _KeyPressRegistry()
+"""Registry instance used by all :class:`MorphKeyPressBehavior`
+widgets."""
+
+
+def _default_key_event_handler(self, *args) -> None:
+    """Default handler for key press and release events without a
+    handler of their own. Shared by all classes and events."""
+    pass
+
+
 class MorphKeyPressBehavior(EventDispatcher):
     """Base class for widgets with key press behavior.
     
     This class provides key press and key release events for the keys
     defined in the `key_map` dictionary. You can extend or modify this
-    dictionary in subclasses. The key names are used to create events
-    like `on_<key_name>_press` and `on_<key_name>_release`.
+    dictionary by overriding it in a subclass body. The key names are
+    used to create events like `on_<key_name>_press` and
+    `on_<key_name>_release`. The mapping is read once when the subclass
+    is created, see :attr:`key_map`.
     """
 
     key_press_enabled: bool = BooleanProperty(True)
@@ -87,25 +168,90 @@ class MorphKeyPressBehavior(EventDispatcher):
         81: 'arrow_down',
         82: 'arrow_up',}
     """Mapping of key codes to key names. You can extend or modify this 
-    dictionary in subclasses. The key names are used to create events 
-    like `on_<key_name>_press` and `on_<key_name>_release`. 
+    dictionary by overriding it in a subclass body. The key names are
+    used to create events like `on_<key_name>_press` and
+    `on_<key_name>_release`. 
     
+    The mapping is read once, when the subclass is created, to build
+    its press and release event tables. Changing the dictionary later,
+    on the class or on an instance, has no effect on which keys
+    dispatch events.
+
     If a key code is not in this dictionary, it will be ignored!"""
 
+    _press_events: Dict[int, str] = {}
+    """Press event names keyed by key code, built from :attr:`key_map`
+    once per subclass in :meth:`__init_subclass__`."""
+
+    _release_events: Dict[int, str] = {}
+    """Release event names keyed by key code, built from 
+    :attr:`key_map` once per subclass in :meth:`__init_subclass__`."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Register the press and release events of :attr:`key_map`
+        for the new subclass.
+
+        The events are added to the class' `__events__`, so Kivy sets
+        them up for every instance without registering them one by one
+        in :meth:`__init__`. See :meth:`_resolve_key_event_handler`
+        for how the handlers of the events are chosen.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._press_events = {}
+        cls._release_events = {}
+        events = list(cls.__dict__.get('__events__', ()))
+        for keycode, name in cls.key_map.items():
+            press_name = cls._press_event_name(name)
+            release_name = cls._release_event_name(name)
+            cls._press_events[keycode] = press_name
+            cls._release_events[keycode] = release_name
+            for event_name in (press_name, release_name):
+                cls._resolve_key_event_handler(event_name)
+                if event_name not in events:
+                    events.append(event_name)
+        cls.__events__ = tuple(events)
+
+    @classmethod
+    def _resolve_key_event_handler(cls, event_name: str) -> None:
+        """Make sure the class has a handler for the given key event.
+
+        The first handler defined in the class hierarchy is used. If
+        none exists, a no-op default handler is set. Default handlers
+        set on a base class do not shadow handlers that other bases
+        define later in the method resolution order.
+
+        Parameters
+        ----------
+        event_name : str
+            Name of the press or release event.
+        """
+        handler = _default_key_event_handler
+        for base in cls.__mro__:
+            candidate = base.__dict__.get(event_name)
+            if candidate is not None and (
+                    candidate is not _default_key_event_handler):
+                handler = candidate
+                break
+        if getattr(cls, event_name, None) is not handler:
+            setattr(cls, event_name, handler)
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        for name in self.key_map.values():
-            press_name = self._press_event_name(name)
-            release_name = self._release_event_name(name)
-            if not hasattr(self, press_name):
-                setattr(self, press_name, lambda self=self, *args: None)
-            if not hasattr(self, release_name):
-                setattr(self, release_name, lambda self=self, *args: None)
-            self.register_event_type(press_name)
-            self.register_event_type(release_name)
-
-        Window.bind(on_key_down=self.on_key_press)
-        Window.bind(on_key_up=self.on_key_release)
+        self.fbind('key_press_enabled', self._update_key_binding)
+        self._update_key_binding()
+
+    def _update_key_binding(self, *args) -> None:
+        """Receive Window key events only while key press events are
+        enabled.
+
+        Registration goes through the shared :class:`_KeyPressRegistry`,
+        so there is a single pair of Window key bindings regardless of
+        how many key press widgets exist.
+        """
+        if self.key_press_enabled:
+            _key_press_registry.register(self)
+        else:
+            _key_press_registry.unregister(self)
     
     @property
     def ignore_key_press(self) -> bool:
@@ -113,19 +259,23 @@ class MorphKeyPressBehavior(EventDispatcher):
         key press events (read-only). By default, it returns False."""
         return False
     
-    def _press_event_name(self, key_name: str) -> str:
+    @staticmethod
+    def _press_event_name(key_name: str) -> str:
         """Return the event name for the given key name."""
         return f'on_{key_name}_press'
     
-    def _release_event_name(self, key_name: str) -> str:
+    @staticmethod
+    def _release_event_name(key_name: str) -> str:
         """Return the event name for the given key name."""
         return f'on_{key_name}_release'
     
     def _skip_keypress_event(self, keycode: int) -> bool:
         """Return True if key press event should be ignored.
-        By default, key press events are ignored if `key_press_enabled`
-        is True, `ignore_key_press` is True, or the keycode is not in
-        `key_map`.
+        By default, key press events are ignored if the keycode is not
+        in `key_map`, `key_press_enabled` is False, or
+        `ignore_key_press` is True. The checks are done in this order
+        and stop at the first match, so unmapped keys are rejected
+        without evaluating `ignore_key_press`.
         
         Parameters
         ----------
@@ -137,11 +287,10 @@ class MorphKeyPressBehavior(EventDispatcher):
         bool
             True if the key press event should be ignored.
         """
-        skip = any((
-            not self.key_press_enabled,
-            self.ignore_key_press,
-            keycode not in self.key_map.keys(),))
-        return skip
+        return (
+            keycode not in self._press_events
+            or not self.key_press_enabled
+            or self.ignore_key_press)
 
     def on_key_press(
             self,
@@ -173,11 +322,9 @@ class MorphKeyPressBehavior(EventDispatcher):
         self.keyboard = keyboard
         self.key_text = text
         self.keycode = keycode
-        self.modifiers = modifiers
-        name = self.key_map[keycode]
-        method_name = self._press_event_name(name)
-        if hasattr(self, method_name):
-            self.dispatch(method_name)
+        if self.modifiers != modifiers:
+            self.modifiers = modifiers
+        self.dispatch(self._press_events[keycode])
         
     def on_key_release(
             self, instance: Any, keyboard: int, keycode: int) -> None:
@@ -196,10 +343,7 @@ class MorphKeyPressBehavior(EventDispatcher):
         if self._skip_keypress_event(keycode):
             return
         
-        name = self.key_map[keycode]
-        method_name = self._release_event_name(name)
-        if hasattr(self, method_name):
-            self.dispatch(method_name)
+        self.dispatch(self._release_events[keycode])
 
 
 class MorphTabNavigationManagerBehavior(MorphKeyPressBehavior):
@@ -233,8 +377,28 @@ class MorphTabNavigationManagerBehavior(MorphKeyPressBehavior):
     :class:`~kivy.properties.StringProperty` and defaults to an
     empty string."""
 
-    _index_last_focus: Dict[str, int] = DictProperty({})
-    """Store the index of the last focus widget."""
+    _index_last_focus: Dict[str, int]
+    """Store the index of the last focus widget per tab group.
+
+    This is a plain dictionary, so updating the entry of one group does
+    not notify observers of the others. :attr:`index_last_focus`
+    dispatches itself when the entry of the current group changes."""
+
+    _tab_widget_indices: Dict[int, int]
+    """Index of each widget in :attr:`tab_widgets`, keyed by the id of
+    the widget. Rebuilt whenever :attr:`tab_widgets` changes."""
+
+    _watched_tab_widgets: Dict[int, Tuple[Any, int]]
+    """Widgets of the current tab group whose `disabled` property is
+    bound to :meth:`refresh_tab_widgets`, keyed by the id of the
+    widget. Each entry holds the widget and the binding uid."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._index_last_focus = {}
+        self._watched_tab_widgets = {}
+        super().__init__(*args, **kwargs)
+        self.fbind('tab_widgets', self._update_tab_widget_indices)
+        self._update_tab_widget_indices()
 
     def _get_index_last_focus(self) -> int:
         """Get the index of the last focus widget for the current tab 
@@ -249,18 +413,22 @@ class MorphTabNavigationManagerBehavior(MorphKeyPressBehavior):
                     break
             else:
                 index = -1
-        return max(index, len(self.tab_widgets) - 1)
+        return min(index, len(self.tab_widgets) - 1)
     
-    def _set_index_last_focus(self, value: int) -> None:
+    def _set_index_last_focus(self, value: int) -> bool:
         """Set the index of the last focus widget for the current tab 
-        group."""
+        group. Returns True, so the property dispatches, only if the
+        stored index changed."""
+        if self._index_last_focus.get(self.current_tab_group) == value:
+            return False
+        
         self._index_last_focus[self.current_tab_group] = value
+        return True
 
     index_last_focus: int = AliasProperty(
         _get_index_last_focus,
         _set_index_last_focus,
         bind=[
-            '_index_last_focus',
             'current_tab_group'])
     """Index of last focus widget.
 
@@ -283,7 +451,7 @@ class MorphTabNavigationManagerBehavior(MorphKeyPressBehavior):
         _get_index_next_focus,
         None,
         bind=[
-            '_index_last_focus',
+            'index_last_focus',
             'current_tab_group'])
     """Index of next focus widget (read-only).
 
@@ -307,39 +475,114 @@ class MorphTabNavigationManagerBehavior(MorphKeyPressBehavior):
     def _get_tab_widgets(self) -> List[Any]:
         """Get the list of widgets in the current tab group.
          Only returns widgets that are not disabled."""
+        widgets = self._tab_widgets.get(self.current_tab_group, [])
+        self._watch_tab_widgets(widgets)
         return [
-            widget for widget in
-            self._tab_widgets.get(self.current_tab_group, [])
+            widget for widget in widgets
             if not getattr(widget, 'disabled', False)]
 
+    def _watch_tab_widgets(self, widgets: List[Any]) -> None:
+        """Bind the `disabled` property of the given widgets to
+        :meth:`refresh_tab_widgets` and release the bindings of
+        widgets that are no longer in the current tab group.
+
+        This keeps the cached :attr:`tab_widgets` up to date when a
+        widget of the group is disabled or enabled, including when it
+        inherits the disabled state from a new parent.
+
+        Parameters
+        ----------
+        widgets : List[Any]
+            All widgets of the current tab group, including disabled
+            ones.
+        """
+        watched = self._watched_tab_widgets
+        still_watched = {}
+        for widget in widgets:
+            key = id(widget)
+            entry = watched.pop(key, None)
+            if entry is None and isinstance(widget, EventDispatcher):
+                uid = widget.fbind('disabled', self.refresh_tab_widgets)
+                if uid:
+                    entry = (widget, uid)
+            if entry is not None:
+                still_watched[key] = entry
+        for widget, uid in watched.values():
+            widget.unbind_uid('disabled', uid)
+        self._watched_tab_widgets = still_watched
+
     tab_widgets: List[Any] = AliasProperty(
         _get_tab_widgets,
         None,
         bind=[
             '_tab_widgets',
-            'current_tab_group'])
+            'current_tab_group'],
+        cache=True)
     """List of widgets in the current tab group (read-only).
 
     This list contains the widgets that will participate in tab
-    navigation for the current tab group.
+    navigation for the current tab group. The list is cached. It is
+    rebuilt when :attr:`current_tab_group` changes, when a group is
+    assigned in :attr:`_tab_widgets`, when a
+    :class:`MorphTabNavigableBehavior` widget changes its group, and
+    when a widget of the current group changes its `disabled` state,
+    e.g. by being moved to a disabled parent. Call
+    :meth:`refresh_tab_widgets` after changing a group list in place.
 
     :attr:`tab_widgets` is a
     :class:`~kivy.properties.AliasProperty` and defaults to an empty
     list."""
 
+    def _update_tab_widget_indices(self, *args) -> None:
+        """Rebuild :attr:`_tab_widget_indices` from the current
+        :attr:`tab_widgets` list."""
+        self._tab_widget_indices = {
+            id(widget): index for index, widget
+            in enumerate(self.tab_widgets)}
+
+    def get_tab_index(self, widget: Any) -> int:
+        """Get the index of a widget in :attr:`tab_widgets`.
+
+        Parameters
+        ----------
+        widget : Any
+            The widget to look up.
+
+        Returns
+        -------
+        int
+            The index of the widget, or -1 if it is not part of the
+            current tab group or is disabled.
+        """
+        return self._tab_widget_indices.get(id(widget), -1)
+
+    def refresh_tab_widgets(self, *args) -> None:
+        """Rebuild the cached :attr:`tab_widgets` list.
+
+        Called by :class:`MorphTabNavigableBehavior` widgets when they
+        join or leave a group and when a widget of the current group
+        changes its disabled state. Call it manually after changing
+        the group lists in place.
+        """
+        self.property('tab_widgets').trigger_change(self, None)
+
     def on_tab_release(self, *args) -> None:
         """Callback for the tab key. Dispatched when tab key is up.
         It sets the focus to the next widget in the current tab group.
         If no widget has focus, it starts from the beginning of the
         list. If the last widget has focus, it wraps around to the first
-        widget."""
-        if not self.tab_widgets:
+        widget. If the next widget is the one that already has focus
+        (e.g. a group with a single widget), it keeps its focus."""
+        tab_widgets = self.tab_widgets
+        if not tab_widgets:
             return
 
-        if self.index_last_focus >= 0:
-            self.tab_widgets[self.index_last_focus].focus = False
+        index_last = self.index_last_focus
+        index_next = self.index_next_focus
+        if index_last >= 0 and index_last != index_next:
+            tab_widgets[index_last].focus = False
 
-        self.tab_widgets[self.index_next_focus].focus = True
+        tab_widgets[index_next].focus = True
 
 
 class MorphTabNavigableBehavior(EventDispatcher):
@@ -382,6 +625,10 @@ class MorphTabNavigableBehavior(EventDispatcher):
     :attr:`tab_group` is a :class:`~kivy.properties.StringProperty` and
     defaults to None."""
 
+    _registered_tab_group: str | None = None
+    """Name of the group this widget is currently registered in with
+    the tab manager, None if it is not registered."""
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.bind(
@@ -417,9 +664,9 @@ class MorphTabNavigableBehavior(EventDispatcher):
         """Register or unregister the widget in the tab manager's
         tab widgets dictionary based on the `tab_group` property.
 
-        First, it removes the widget from all existing groups. Then,
-        if `tab_group` is not None, it adds the widget to the specified
-        group.
+        First, it removes the widget from the group it is currently
+        registered in. Then, if `tab_group` is not None, it adds the
+        widget to the specified group.
         
         Parameters
         ----------
@@ -429,18 +676,22 @@ class MorphTabNavigableBehavior(EventDispatcher):
             The tab group name. If None, the widget is unregistered from
             all groups.
         """
-        if not self.tab_manager:
+        manager = self.tab_manager
+        if not manager:
             return
         
-        for group, widgets in self.tab_manager._tab_widgets.items():
-            if self in widgets:
-                widgets.remove(self)
+        widgets = manager._tab_widgets.get(self._registered_tab_group)
+        if widgets is not None and self in widgets:
+            widgets.remove(self)
+        self._registered_tab_group = None
         
         if tab_group is not None:
-            if tab_group not in self.tab_manager._tab_widgets:
-                self.tab_manager._tab_widgets[tab_group] = []
-            if self not in self.tab_manager._tab_widgets[tab_group]:
-                self.tab_manager._tab_widgets[tab_group].append(self)
+            if tab_group not in manager._tab_widgets:
+                manager._tab_widgets[tab_group] = []
+            if self not in manager._tab_widgets[tab_group]:
+                manager._tab_widgets[tab_group].append(self)
+            self._registered_tab_group = tab_group
+        manager.refresh_tab_widgets()
 
     def _sync_focus_to_manager(self, *args) -> None:
         """Sync the widget's focus state with the tab manager.
@@ -450,7 +701,6 @@ class MorphTabNavigableBehavior(EventDispatcher):
         accordingly."""
         if self.focus and self.tab_manager and self.tab_group:
             self.tab_manager.current_tab_group = self.tab_group
-            for i, widget in enumerate(self.tab_manager.tab_widgets):
-                if widget is self:
-                    self.tab_manager.index_last_focus = i
-                    break
\ No newline at end of file
+            index = self.tab_manager.get_tab_index(self)
+            if index >= 0:
+                self.tab_manager.index_last_focus = index
\ No newline at end of file
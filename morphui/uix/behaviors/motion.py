@@ -35,7 +35,8 @@ class MorphMotionBaseBehavior(MorphScaleBehavior):
 
     is_open: bool = AliasProperty(
         lambda self: bool(self.parent),
-        bind=['parent'])
+        bind=['parent'],
+        cache=True)
     """Flag indicating whether the menu is currently open.
 
     This property is `True` when the menu is visible and `False`
@@ -63,6 +63,8 @@ from morphui.uix.behaviors import MorphInteractionLayerBehavior
 from morphui.uix.container import MorphIconLabelContainer
 from morphui.uix.container import MorphLabelIconContainer
 
+from morphui.constants import ICON
+
 
 __all__ = [
     'MorphSimpleIconButton',
@@ -416,8 +418,8 @@ class MorphTextIconToggleButton(
     """
     default_config: Dict[str, Any] = (
         MorphTextIconButton.default_config.copy() | dict(
-        normal_icon='chevron-down',
-        active_icon='chevron-up',))
+        normal_icon=ICON.DD_MENU_CLOSED,
+        active_icon=ICON.DD_MENU_OPEN,))
     
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
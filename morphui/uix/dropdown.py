@@ -26,6 +26,7 @@ from typing import Dict
 from typing import Literal
 
 from textwrap import dedent
+from functools import partial
 
 from kivy.lang import Builder
 from kivy.clock import Clock
@@ -55,6 +56,8 @@ from morphui.uix.textfield import MorphTextFieldFilled
 from morphui.uix.textfield import MorphTextFieldRounded
 from morphui.uix.textfield import MorphTextFieldOutlined
 
+from morphui.constants import ICON
+
 
 __all__ = [
     'MorphDropdownList',
@@ -306,12 +309,24 @@ class MorphDropdownMenu(
             elevation=2,
             same_width_as_caller=True,)
     """Default configuration for the MorphDropdownMenu."""
+
+    _data_changed: bool = True
+    """Whether the data of :attr:`dropdown_list` changed since the menu
+    was last opened.
+
+    Used by :meth:`on_pre_open` to skip refreshing the list views when
+    the menu is reopened with the same data."""
     
     def __init__(self, **kwargs) -> None:
         self.dropdown_list = MorphDropdownList()
         super().__init__(**kwargs)
         self.layout_manager = self.dropdown_list.layout_manager
         self.add_widget(self.dropdown_list)
+        self.dropdown_list.fbind('data', self._on_list_data_changed)
+
+    def _on_list_data_changed(self, *args) -> None:
+        """Mark the list data as changed since the last opening."""
+        self._data_changed = True
 
     def _update_caller_bindings(self, *args) -> None:
         """Update bindings to the caller button's position and size.
@@ -330,12 +345,15 @@ class MorphDropdownMenu(
 
         This method is called just before the dropdown menu is opened.
         It sets the focus in the dropdown list based on the caller's
-        current text value.
+        current text value. The list views are only refreshed if the
+        data changed since the menu was last opened.
         """
         text = getattr(self.caller, 'text', '')
         if text in self.dropdown_list.available_texts:
             self.dropdown_list.set_focus_by_text(text)
-        self.dropdown_list.refresh_from_data()
+        if self._data_changed:
+            self._data_changed = False
+            self.dropdown_list.refresh_from_data()
 
     def on_dismiss(self, *args) -> None:
         """Handle actions after the dropdown menu is dismissed.
@@ -402,7 +420,7 @@ class MorphDropdownSelect(
     ```
     """
 
-    normal_icon: str = StringProperty('chevron-down')
+    normal_icon: str = StringProperty(ICON.DD_MENU_CLOSED)
     """Icon for the normal (closed) state of the dropdown filter field.
 
     This property holds the icon name used when the dropdown is in its
@@ -413,7 +431,7 @@ class MorphDropdownSelect(
     `'chevron-down'`.
     """
 
-    active_icon: str | None  = StringProperty('chevron-up')
+    active_icon: str | None  = StringProperty(ICON.DD_MENU_OPEN)
     """Icon for the focused (open) state of the dropdown filter field.
 
     This property holds the icon name used when the dropdown is in its
@@ -449,7 +467,7 @@ class MorphDropdownSelect(
             items=kwargs.pop('items', []),
             item_release_callback=kwargs.pop(
                 'item_release_callback',
-                lambda item, index: self.dispatch('on_item_release', item, index))
+                partial(self.dispatch, 'on_item_release'))
                 ) | kw_dropdown
         self.dropdown_menu = MorphDropdownMenu(**kw_dropdown)
         super().__init__(**kwargs)
@@ -482,8 +500,12 @@ class MorphDropdownSelect(
         This method is not called if an `item_release_callback` is 
         provided during initialization.
         """
-        self.label_text = getattr(
-            item, 'label_text', getattr(item, 'text', str(item)))
+        if hasattr(item, 'label_text'):
+            self.label_text = item.label_text
+        elif hasattr(item, 'text'):
+            self.label_text = item.text
+        else:
+            self.label_text = str(item)
         self.trigger_action()
 
 
@@ -570,7 +592,7 @@ class MorphDropdownFilterField(MorphTextField):
     ```
     """
 
-    normal_trailing_icon: str = StringProperty('chevron-down')
+    normal_trailing_icon: str = StringProperty(ICON.DD_MENU_CLOSED)
     """Icon for the normal (closed) state of the dropdown filter field.
 
     This property holds the icon name used when the dropdown is in its
@@ -581,7 +603,7 @@ class MorphDropdownFilterField(MorphTextField):
     `'chevron-down'`.
     """
 
-    focus_trailing_icon: str = StringProperty('chevron-up')
+    focus_trailing_icon: str = StringProperty(ICON.DD_MENU_OPEN)
     """Icon for the focused (open) state of the dropdown filter field.
 
     This property holds the icon name used when the dropdown is in its
@@ -615,7 +637,7 @@ class MorphDropdownFilterField(MorphTextField):
             items=kwargs.pop('items', []),
             item_release_callback=kwargs.pop(
                 'item_release_callback',
-                lambda item, index: self.dispatch('on_item_release', item, index))
+                partial(self.dispatch, 'on_item_release'))
                 ) | kw_dropdown
         self.dropdown_menu = MorphDropdownMenu(**kw_dropdown)
         kwargs['trailing_icon'] = kwargs.get(
@@ -651,10 +673,9 @@ class MorphDropdownFilterField(MorphTextField):
         text : str
             The new text value of the filter field.
         """
-        items = self.dropdown_menu.dropdown_list._source_items
-        full_texts = [item['label_text'] for item in items]
-        filter_value = '' if text in full_texts else text.strip()
-        self.dropdown_menu.dropdown_list.filter_value = filter_value
+        dropdown_list = self.dropdown_menu.dropdown_list
+        filter_value = '' if dropdown_list.has_item_text(text) else text.strip()
+        dropdown_list.filter_value = filter_value
     
     def _on_focus_changed(
             self,
@@ -1119,9 +1140,9 @@ class MorphDropdownMultiselect(
         self._options_container.add_widget(chip)
         self._options_container.add_widget(self._text_input)
 
-        items = self.dropdown_menu.items
-        if option not in [i['label_text'] for i in items]:
-            self.dropdown_menu.items = items + [{'label_text': option}]
+        if not self.dropdown_menu.dropdown_list.has_item_text(option):
+            self.dropdown_menu.items = (
+                self.dropdown_menu.items + [{'label_text': option}])
     
     def validate(self, text: str) -> bool:
         """Validate the current text input.
@@ -1,6 +1,7 @@
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Set
 from typing import Literal
 from typing import Callable
 
@@ -387,9 +388,16 @@ def filter_item(
     if not filter_value:
         return False
 
-    query = filter_value.lower()
-    text = item_text.lower()
+    return _filter_lowered_item(
+        item_text.lower(), filter_value.lower(), filter_mode)
 
+
+def _filter_lowered_item(text: str, query: str, filter_mode: str) -> bool:
+    """Same as :func:`filter_item` but for already lowercased inputs.
+
+    This lets callers that test many items against the same query
+    lowercase the item texts once and reuse them across keystrokes.
+    """
     if filter_mode == 'contains':
         return query not in text
     elif filter_mode == 'prefix':
@@ -476,6 +484,29 @@ class BaseListView(
     and defaults to an empty list.
     """
 
+    _raw_items: List[Dict[str, Any]] = []
+    """Items as they were last set, before :attr:`default_data` and
+    the release callback are merged into them.
+
+    :attr:`_source_items` is rebuilt from these, so that a change of
+    :attr:`default_data` replaces the previous defaults instead of
+    being merged on top of them."""
+
+    _source_texts: Dict[int, str] = {}
+    """Lowercased item texts of :attr:`_source_items` keyed by the
+    ``id`` of each item dictionary.
+
+    Rebuilt whenever the source items are set so that filtering does
+    not extract and lowercase every item text again on each change of
+    :attr:`filter_value`."""
+
+    _source_text_set: Set[str] = frozenset()
+    """Exact item texts of :attr:`_source_items`.
+
+    Rebuilt together with :attr:`_source_texts` so that
+    :meth:`has_item_text` is a set lookup instead of a scan over all
+    items."""
+
     def _get_items(self) -> List[Dict[str, Any]]:
         """Retrieve the list of items after applying the current filter.
 
@@ -483,20 +514,38 @@ class BaseListView(
         in the list view after filtering out items based on the current
         filter value.
 
+        Unless :meth:`should_filter_item` is overridden, the filter
+        value is converted and lowercased once for the whole pass
+        instead of once per item.
+
         Returns
         -------
         List[Dict[str, Any]]
             A list of dictionaries representing the filtered list items.
         """
-        return list(filter(
-            lambda item: not self.should_filter_item(item),
-            self._source_items))
+        should_filter_item = self.should_filter_item
+        if should_filter_item.__func__ is not BaseListView.should_filter_item:
+            return [
+                item for item in self._source_items
+                if not should_filter_item(item)]
+
+        query = str(self.filter_value).lower()
+        if not query:
+            return list(self._source_items)
+
+        filter_mode = self.filter_mode
+        return [
+            item for item in self._source_items
+            if not _filter_lowered_item(
+                self._lowered_item_text(item), query, filter_mode)]
     
     def _set_items(self, items: List[Dict[str, Any]]) -> None:
         """Set the list of items to be displayed in the list view.
 
-        This method updates the internal storage of items and refreshes
-        the displayed data in the RecycleView.
+        This method updates the internal storage of items. The text
+        caches are rebuilt before the storage is assigned, so the
+        resulting :attr:`items` dispatch, which refreshes the displayed
+        data through :meth:`refresh_data`, filters against them.
 
         Parameters
         ----------
@@ -504,13 +553,19 @@ class BaseListView(
             A list of dictionaries representing the items to be displayed
             in the list view.
         """
-        self._source_items = [
+        self._raw_items = list(items)
+        default_data = self.default_data
+        release_callback = self.item_release_callback
+        source_items = [
             {   
-                **self.default_data,
+                **default_data,
                 **item_data,
-                'release_callback': self.item_release_callback} 
-            for item_data in items]
-        self.data = self._get_items()
+                'release_callback': release_callback} 
+            for item_data in self._raw_items]
+        texts = {id(item): self._item_text(item) for item in source_items}
+        self._source_text_set = frozenset(texts.values())
+        self._source_texts = {k: t.lower() for k, t in texts.items()}
+        self._source_items = source_items
 
     items: List[Dict[str, Any]] = AliasProperty(
         _get_items,
@@ -548,7 +603,9 @@ class BaseListView(
         List[str]
             A list of label texts extracted from the current data.
         """
-        return [i.get('label_text', i.get('text', '')) for i in self.data]
+        return [
+            i['label_text'] if 'label_text' in i else i.get('text', '')
+            for i in self.data]
 
     available_texts: List[str] = AliasProperty(
         _get_available_texts,
@@ -589,7 +646,11 @@ class BaseListView(
         """
         config = self.default_config.copy() | kwargs
         super().__init__(**config)
-        self.bind(items=self.refresh_data) # type: ignore
+        self.bind( # type: ignore
+            items=self.refresh_data,
+            item_release_callback=self._refresh_source_items,
+            default_data=self._refresh_source_items)
+        self._refresh_source_items()
         self.refresh_data()
 
     def should_filter_item(self, item: Dict[str, Any]) -> bool:
@@ -612,16 +673,92 @@ class BaseListView(
             `True` if the item should be filtered out, `False`
             otherwise.
         """
-        item_text = str(item.get('text', item.get('label_text', '')))
-        return filter_item(item_text, str(self.filter_value), self.filter_mode)
+        filter_value = str(self.filter_value)
+        if not filter_value:
+            return False
+
+        return _filter_lowered_item(
+            self._lowered_item_text(item),
+            filter_value.lower(),
+            self.filter_mode)
+
+    def has_item_text(self, text: str) -> bool:
+        """Check whether any source item has exactly the given text.
+
+        The check runs against all items, regardless of the current
+        :attr:`filter_value`.
+
+        Parameters
+        ----------
+        text : str
+            The text to look for.
+
+        Returns
+        -------
+        bool
+            `True` if an item with this text exists, `False` otherwise.
+        """
+        return text in self._source_text_set
+
+    @staticmethod
+    def _item_text(item: Dict[str, Any]) -> str:
+        """Return the text of a list item used for filtering.
+
+        Parameters
+        ----------
+        item : Dict[str, Any]
+            A dictionary representing a single list item.
+
+        Returns
+        -------
+        str
+            The `text` entry of the item, falling back to `label_text`
+            or an empty string.
+        """
+        if 'text' in item:
+            return str(item['text'])
+        return str(item.get('label_text', ''))
     
+    def _lowered_item_text(self, item: Dict[str, Any]) -> str:
+        """Return the lowercased text of a list item.
+
+        The text is taken from the cache built when the source items
+        were set. Items that are not part of the source items are
+        converted on the fly.
+
+        Parameters
+        ----------
+        item : Dict[str, Any]
+            A dictionary representing a single list item.
+
+        Returns
+        -------
+        str
+            The lowercased text of the item.
+        """
+        item_text = self._source_texts.get(id(item))
+        if item_text is None:
+            item_text = self._item_text(item).lower()
+        return item_text
+
+    def _refresh_source_items(self, *args) -> None:
+        """Rebuild the source items with the current release callback
+        and default data.
+
+        Called when :attr:`item_release_callback` or
+        :attr:`default_data` changes so that every item refers to the
+        new callback and contains the new defaults. This also rebuilds
+        the lowercased text cache used for filtering.
+        """
+        self._set_items(self._raw_items)
+
     def refresh_data(self, *args) -> None:
         """Refresh the displayed data in the list view.
 
         This method updates the RecycleView's data based on the
-        current list of items after applying any filtering. First, it
-        ensures that the internal `_items` storage is up to date,
-        then it refreshes the displayed data accordingly.
+        current list of items after applying any filtering. The source
+        items and their cached texts are left untouched, so typing a
+        filter does not rebuild them on every change of
+        :attr:`filter_value`.
         """
-        self._set_items(self._source_items)
         self.data = self.items
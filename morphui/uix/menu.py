@@ -196,11 +196,12 @@ class MorphDropdownMenu(
             dictionary should contain the properties for a single
             MorphDropdownMenuItem.
         """
-        if self.item_release_callback is None:
+        release_callback = self.item_release_callback
+        if release_callback is None:
             self._all_items = items
         else:
             self._all_items = [
-                {'on_release': self.item_release_callback, **item} for item in items]
+                {'on_release': release_callback, **item} for item in items]
 
     items: List[Dict[str, Any]] = AliasProperty(
         _get_items,
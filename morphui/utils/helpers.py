@@ -348,10 +348,11 @@ def calculate_widget_local_pos(
       automatically
     """
     x_coord, y_coord = window_pos
-    x_absolute, y_absolute = widget.to_window(widget.x, widget.y)
-    x_offset = widget.x - x_absolute
-    y_offset = widget.y - y_absolute
-    return (x_coord + x_offset, y_coord + y_offset)
+    x, y = widget.pos
+    x_absolute, y_absolute = widget.to_window(x, y)
+    if x_absolute == x and y_absolute == y:
+        return (x_coord, y_coord)
+    return (x_coord + x - x_absolute, y_coord + y - y_absolute)
 
 
 @lru_cache(maxsize=128)
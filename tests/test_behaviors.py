@@ -1,3 +1,4 @@
+import gc
 import sys
 import pytest
 from unittest.mock import Mock, patch
@@ -7,6 +8,7 @@ sys.path.append(str(Path(__file__).parent.resolve()))
 
 from kivy.clock import Clock
 from kivy.uix.widget import Widget
+from kivy.core.window import Window
 from kivy.properties import BooleanProperty
 from kivy.properties import ColorProperty
 from kivy.uix.behaviors import FocusBehavior
@@ -15,10 +17,14 @@ from kivy.input.motionevent import MotionEvent
 from morphui.utils.dotdict import DotDict
 from morphui.uix.behaviors import MorphHoverBehavior
 from morphui.uix.behaviors import MorphHoverEnhancedBehavior
+from morphui.uix.behaviors.hover import _HoverRegistry
+from morphui.uix.behaviors.hover import _hover_registry
 from morphui.uix.behaviors import MorphColorThemeBehavior
 from morphui.uix.behaviors import MorphTypographyBehavior
 from morphui.uix.behaviors import MorphThemeBehavior
 from morphui.uix.behaviors import MorphKeyPressBehavior
+from morphui.uix.behaviors.keypress import _KeyPressRegistry
+from morphui.uix.behaviors.keypress import _key_press_registry
 from morphui.uix.behaviors import MorphTabNavigationManagerBehavior
 from morphui.uix.behaviors import MorphTabNavigableBehavior
 from morphui.uix.behaviors import MorphSurfaceLayerBehavior
@@ -35,7 +41,10 @@ from morphui.uix.behaviors import MorphOverlayLayerBehavior
 from morphui.uix.behaviors.touch import MorphButtonBehavior
 from morphui.uix.behaviors.touch import MorphToggleButtonBehavior
 from morphui.uix.behaviors.composition import MorphTripleLabelBehavior
+from morphui.uix.behaviors.composition import MorphTrailingWidgetBehavior
 from morphui.uix.label import MorphTextLabel
+from morphui.uix.label import MorphTrailingIconLabel
+from morphui.uix.menu import MorphDropdownMenu
 
 
 class TestMorphDeclarativeBehavior:
@@ -84,6 +93,18 @@ class TestMorphDeclarativeBehavior:
         assert isinstance(identities, DotDict)
         assert identities is widget._identities
 
+    def test_identities_not_shared(self):
+        """Test each instance has its own identities mapping."""
+        parent1 = self.TestWidget()
+        parent2 = self.TestWidget()
+        child = self.ChildWidget(identity='test_child')
+
+        parent1.add_widget(child)
+
+        assert parent1.identities is not parent2.identities
+        assert 'test_child' in parent1.identities
+        assert 'test_child' not in parent2.identities
+
     def test_add_widget_with_id(self):
         """Test adding a widget with an id updates identities."""
         parent = self.TestWidget()
@@ -118,6 +139,62 @@ class TestMorphDeclarativeBehavior:
         parent.remove_widget(child)
         assert child not in parent.declarative_children
 
+    def test_declarative_children_in_sync_after_add_and_remove(self):
+        """Test declarative_children and identities follow add_widget
+        and remove_widget."""
+        parent = self.TestWidget()
+        child1 = self.ChildWidget(identity='child1')
+        child2 = self.ChildWidget(identity='child2')
+
+        parent.add_widget(child1)
+        parent.add_widget(child2)
+        assert parent.declarative_children == [child1, child2]
+        assert set(parent.children) == {child1, child2}
+        assert set(parent.identities) == {'child1', 'child2'}
+        assert parent._declarative_children_set == {child1, child2}
+
+        parent.remove_widget(child1)
+        assert parent.declarative_children == [child2]
+        assert parent.children == [child2]
+        assert set(parent.identities) == {'child2'}
+        assert parent._declarative_children_set == {child2}
+
+        parent.add_widget(child1)
+        assert parent.declarative_children == [child2, child1]
+        assert set(parent.identities) == {'child1', 'child2'}
+
+    def test_declarative_children_assignment_syncs_tree(self):
+        """Test assigning declarative_children replaces the children
+        and identities."""
+        child1 = self.ChildWidget(identity='child1')
+        child2 = self.ChildWidget(identity='child2')
+        child3 = self.ChildWidget(identity='child3')
+        parent = self.TestWidget(child1, child2)
+
+        parent.declarative_children = [child2, child3]
+        assert parent.declarative_children == [child2, child3]
+        assert set(parent.children) == {child2, child3}
+        assert child1.parent is None
+        assert set(parent.identities) == {'child2', 'child3'}
+        assert parent._declarative_children_set == {child2, child3}
+
+    def test_widget_added_twice_not_duplicated(self):
+        """Test a widget appended to declarative_children, and thereby
+        added to the tree, is listed only once."""
+        parent = self.TestWidget()
+        child = self.ChildWidget(identity='child')
+
+        parent.declarative_children.append(child)
+        assert parent.declarative_children == [child]
+        assert parent.children == [child]
+        assert parent.identities.child is child
+
+        parent.remove_widget(child)
+        parent.add_widget(child)
+        parent.declarative_children = list(parent.declarative_children)
+        assert parent.declarative_children == [child]
+        assert parent.children == [child]
+
     def test_register_declarative_child(self):
         """Test the _register_declarative_child method."""
         parent = self.TestWidget()
@@ -195,6 +272,112 @@ class TestMorphHoverBehavior:
         widget.get_root_window = Mock(return_value=mock_root_window)
         assert widget.is_displayed is True
 
+    def test_registry_follows_hover_enabled_and_parent(self):
+        """Test widgets are registered only while hover is enabled and
+        they have a parent."""
+        widget = self.TestWidget()
+        assert id(widget) not in _hover_registry._widgets
+
+        parent = Widget()
+        parent.add_widget(widget)
+        assert id(widget) in _hover_registry._widgets
+
+        widget.hover_enabled = False
+        assert id(widget) not in _hover_registry._widgets
+
+        widget.hover_enabled = True
+        assert id(widget) in _hover_registry._widgets
+
+        parent.remove_widget(widget)
+        assert id(widget) not in _hover_registry._widgets
+
+    def test_registry_binds_window_once(self):
+        """Test the registry binds a single Window observer for any
+        number of widgets."""
+        registry = _HoverRegistry()
+        observers = len(Window.get_property_observers('mouse_pos'))
+        widgets = [self.TestWidget() for _ in range(3)]
+        for widget in widgets:
+            registry.register(widget)
+        registry.register(widgets[0])
+
+        assert len(registry._widgets) == 3
+        assert len(Window.get_property_observers('mouse_pos')) == (
+            observers + 1)
+        for widget in widgets:
+            registry.unregister(widget)
+
+    def test_registry_unbinds_window_when_empty(self):
+        """Test the Window binding is released with the last widget."""
+        registry = _HoverRegistry()
+        observers = len(Window.get_property_observers('mouse_pos'))
+        widget1 = self.TestWidget()
+        widget2 = self.TestWidget()
+        registry.register(widget1)
+        registry.register(widget2)
+
+        registry.unregister(widget1)
+        assert registry._uid != 0
+
+        registry.unregister(widget2)
+        assert registry._uid == 0
+        assert registry._widgets == {}
+        assert len(Window.get_property_observers('mouse_pos')) == observers
+
+    def test_registry_drops_dead_widgets(self):
+        """Test garbage collected widgets are removed from the
+        registry."""
+        registry = _HoverRegistry()
+        widget = self.TestWidget()
+        key = id(widget)
+        registry.register(widget)
+        assert key in registry._widgets
+
+        del widget
+        gc.collect()
+        assert key not in registry._widgets
+        assert registry._uid == 0
+
+    def test_mouse_moves_coalesced_until_next_frame(self):
+        """Test only the last mouse position of a frame is applied and
+        enter/leave events still fire."""
+        widget = self.TestWidget(
+            pos=(100, 100), size=(100, 100), size_hint=(None, None))
+        events = []
+        widget.bind(
+            on_enter=lambda *args: events.append('enter'),
+            on_leave=lambda *args: events.append('leave'))
+        Window.add_widget(widget)
+        try:
+            Window.mouse_pos = (10, 10)
+            Clock.tick()
+            positions = []
+            widget.on_mouse_pos = Mock(
+                side_effect=lambda instance, pos: positions.append(pos))
+
+            Window.mouse_pos = (50, 50)
+            Window.mouse_pos = (120, 130)
+            Window.mouse_pos = (150, 160)
+            assert positions == []
+            Clock.tick()
+            assert positions == [(150, 160)]
+
+            del widget.on_mouse_pos
+            Window.mouse_pos = (50, 50)
+            Window.mouse_pos = (150, 160)
+            Clock.tick()
+            assert widget.hovered is True
+            assert widget.current_pos == (150, 160)
+            assert events == ['enter']
+
+            Window.mouse_pos = (120, 130)
+            Window.mouse_pos = (300, 300)
+            Clock.tick()
+            assert widget.hovered is False
+            assert events == ['enter', 'leave']
+        finally:
+            Window.remove_widget(widget)
+
 
 class TestMorphHoverEnhancedBehavior:
     """Test suite for MorphHoverEnhancedBehavior class (enhanced hover with edges/corners)."""
@@ -254,6 +437,25 @@ class TestMorphHoverEnhancedBehavior:
         widget.hovered_edges = ['right', 'bottom']
         assert widget.get_hovered_corner() == 'bottom-right'
 
+    @patch('kivy.core.window.Window')
+    def test_corner_events(self, mock_window):
+        """Test that corner events are only fired for actual corners."""
+        widget = self.TestWidget()
+        events = []
+        widget.bind(
+            on_enter_corner=lambda instance, corner: events.append(
+                ('enter', corner)),
+            on_leave_corner=lambda instance, corner: events.append(
+                ('leave', corner)))
+
+        widget._last_hovered_corner = widget.hovered_corner
+        widget.hovered_corner = 'top-left'
+        assert events == [('enter', 'top-left')]
+
+        widget._last_hovered_corner = widget.hovered_corner
+        widget.hovered_corner = None
+        assert events == [('enter', 'top-left'), ('leave', 'top-left')]
+
     @patch('kivy.core.window.Window')
     def test_edge_size_property(self, mock_window):
         """Test the edge_size property."""
@@ -1237,6 +1439,70 @@ class TestMorphKeyPressBehavior:
         assert len(press_called) == 1
         assert widget.key_text == 'a'
 
+    def test_registry_follows_key_press_enabled(self):
+        """Test widgets are registered only while key presses are
+        enabled."""
+        widget = self.TestWidget()
+        assert id(widget) in _key_press_registry._widgets
+
+        widget.key_press_enabled = False
+        assert id(widget) not in _key_press_registry._widgets
+
+        widget.key_press_enabled = True
+        assert id(widget) in _key_press_registry._widgets
+
+    def test_registry_forwards_window_key_events(self):
+        """Test Window key events reach the registered widgets."""
+        widget = self.TestWidget()
+        events = []
+        widget.bind(
+            on_enter_press=lambda *args: events.append('press'),
+            on_enter_release=lambda *args: events.append('release'))
+
+        Window.dispatch('on_key_down', 40, 40, None, [])
+        Window.dispatch('on_key_up', 40, 40)
+        assert events == ['press', 'release']
+
+        widget.key_press_enabled = False
+        Window.dispatch('on_key_down', 40, 40, None, [])
+        assert events == ['press', 'release']
+
+    def test_registry_unbinds_window_when_empty(self):
+        """Test the Window key bindings are released with the last
+        widget."""
+        registry = _KeyPressRegistry()
+        down = len(Window.get_property_observers('on_key_down'))
+        up = len(Window.get_property_observers('on_key_up'))
+        widget1 = self.TestWidget()
+        widget2 = self.TestWidget()
+        registry.register(widget1)
+        registry.register(widget2)
+        assert len(Window.get_property_observers('on_key_down')) == down + 1
+        assert len(Window.get_property_observers('on_key_up')) == up + 1
+
+        registry.unregister(widget1)
+        assert registry._key_down_uid != 0
+
+        registry.unregister(widget2)
+        assert registry._key_down_uid == 0
+        assert registry._key_up_uid == 0
+        assert len(Window.get_property_observers('on_key_down')) == down
+        assert len(Window.get_property_observers('on_key_up')) == up
+
+    def test_registry_drops_dead_widgets(self):
+        """Test garbage collected widgets are removed from the
+        registry."""
+        registry = _KeyPressRegistry()
+        widget = self.TestWidget()
+        key = id(widget)
+        registry.register(widget)
+        assert key in registry._widgets
+
+        del widget
+        gc.collect()
+        assert key not in registry._widgets
+        assert registry._key_down_uid == 0
+
 
 class TestMorphTabNavigationManagerBehavior:
     """Test suite for MorphTabNavigationManagerBehavior class."""
@@ -1309,6 +1575,45 @@ class TestMorphTabNavigationManagerBehavior:
         assert widget2 not in tab_widgets
         assert widget3 in tab_widgets
 
+    def test_tab_widgets_follow_disabled_changes(self):
+        """Test the cached tab_widgets follow disabled changes of any
+        widget in the current group, including inherited ones."""
+        manager = self.TestManager()
+        manager.current_tab_group = "form1"
+        widget1 = Widget()
+        widget2 = Widget()
+        manager._tab_widgets["form1"] = [widget1, widget2]
+        assert manager.tab_widgets == [widget1, widget2]
+
+        widget1.disabled = True
+        assert manager.tab_widgets == [widget2]
+
+        widget1.disabled = False
+        assert manager.tab_widgets == [widget1, widget2]
+
+        disabled_parent = Widget(disabled=True)
+        disabled_parent.add_widget(widget2)
+        assert manager.tab_widgets == [widget1]
+
+        disabled_parent.remove_widget(widget2)
+        assert manager.tab_widgets == [widget1, widget2]
+
+    def test_tab_widgets_release_other_group_bindings(self):
+        """Test widgets of a group that is no longer current do not
+        refresh tab_widgets anymore."""
+        manager = self.TestManager()
+        manager.current_tab_group = "form1"
+        widget1 = Widget()
+        widget2 = Widget()
+        manager._tab_widgets["form1"] = [widget1]
+        manager._tab_widgets["form2"] = [widget2]
+        assert id(widget1) in manager._watched_tab_widgets
+
+        manager.current_tab_group = "form2"
+        assert manager.tab_widgets == [widget2]
+        assert id(widget1) not in manager._watched_tab_widgets
+        assert id(widget2) in manager._watched_tab_widgets
+
     def test_index_last_focus(self):
         """Test index_last_focus property."""
         manager = self.TestManager()
@@ -1327,8 +1632,8 @@ class TestMorphTabNavigationManagerBehavior:
         # Test when no widget has focus
         widget2.focus = False
         manager._index_last_focus = {}  # Clear cache
-        # When no widget has focus, returns max(-1, len-1) = max(-1, 1) = 1
-        assert manager.index_last_focus == 1
+        # When no widget has focus, returns -1
+        assert manager.index_last_focus == -1
 
     def test_index_next_focus(self):
         """Test index_next_focus property."""
@@ -1366,18 +1671,16 @@ class TestMorphTabNavigationManagerBehavior:
         
         manager._tab_widgets["form1"] = [widget1, widget2, widget3]
         
-        # First tab: index_last_focus will be max(-1, 2) = 2 initially
-        # So it will unfocus widget at index 2 and focus widget at index_next_focus
-        # index_next_focus when index_last_focus is 2 should be (2+1) % 3 = 0
+        # First tab: no widget has focus, so index_last_focus is -1
+        # and focus starts at the first widget
         initial_index = manager.index_last_focus
-        assert initial_index == 2  # max(-1, len-1) = max(-1, 2) = 2
+        assert initial_index == -1
         initial_next = manager.index_next_focus
-        # index_next_focus = index + 1, if >= len, wraps to 0
-        # So 2 + 1 = 3, which is >= 3, so wraps to 0
+        # index_next_focus = index + 1 = 0
         assert initial_next == 0
         
         manager.on_tab_release()
-        # Should unfocus widget3 (index 2) and focus widget1 (index 0)
+        # Should focus widget1 (index 0) and leave widget3 untouched
         assert widget1.focus is True
         assert widget3.focus is False
         
@@ -1402,6 +1705,24 @@ class TestMorphTabNavigationManagerBehavior:
         manager.on_tab_release()
         assert widget1.focus is True
 
+    def test_on_tab_release_single_widget_keeps_focus(self):
+        """Test tab release does not refocus the only widget."""
+
+        class FocusWidget(Widget):
+            focus = BooleanProperty(False)
+
+        manager = self.TestManager()
+        manager.current_tab_group = "form1"
+        widget = FocusWidget(focus=True)
+        manager._tab_widgets["form1"] = [widget]
+
+        focus_changes = []
+        widget.bind(focus=lambda instance, value: focus_changes.append(value))
+
+        manager.on_tab_release()
+        assert widget.focus is True
+        assert focus_changes == []
+
     def test_on_tab_release_empty_widgets(self):
         """Test tab release when no widgets in group."""
         manager = self.TestManager()
@@ -3927,6 +4248,22 @@ class TestMorphElevationBehavior:
         widget.shadow_color = [0.2, 0.2, 0.2, 0.8]
         assert widget.shadow_color == [0.2, 0.2, 0.2, 0.8]
 
+    def test_shadow_keeps_canvas_position_when_created_late(self) -> None:
+        """Test the shadow is drawn inside the menu's stencil and scale,
+        even when it is only created once the menu is elevated."""
+        menu = MorphDropdownMenu(elevation=0)
+        names = [type(i).__name__ for i in menu.canvas.before.children]
+        assert names[:7] == [
+            'StencilPush', 'BindTexture', 'Rectangle', 'StencilUse',
+            'PushMatrix', 'Scale', 'InstructionGroup']
+        shadow_group = menu.canvas.before.children[6]
+        assert shadow_group.children == []
+
+        menu.elevation = 2
+        assert menu.canvas.before.children[6] is shadow_group
+        assert [type(i).__name__ for i in shadow_group.children] == [
+            'Color', 'BoxShadow']
+
 
 class TestMorphRippleBehavior:
     """Test suite for MorphRippleBehavior class."""
@@ -5569,9 +5906,10 @@ class TestMorphTripleLabelBehavior:
         assert widget.tertiary_text == 'Widget Tertiary'
 
     def test_update_heading_widget_none(self):
-        """Test _update_heading_widget when widget is None."""
+        """Test _update_triple_label for heading when widget is None."""
         widget = self.TestWidget()
-        widget._update_heading_widget(widget, None)
+        widget._update_triple_label(
+            '_heading_text', 'heading_text', widget, None)
         # Should not raise an error
 
     def test_update_heading_widget_updates_widget(self):
@@ -5587,9 +5925,10 @@ class TestMorphTripleLabelBehavior:
         assert heading_widget.text == 'Pre-set Heading'
 
     def test_update_supporting_widget_none(self):
-        """Test _update_supporting_widget when widget is None."""
+        """Test _update_triple_label for supporting when widget is None."""
         widget = self.TestWidget()
-        widget._update_supporting_widget(widget, None)
+        widget._update_triple_label(
+            '_supporting_text', 'supporting_text', widget, None)
         # Should not raise an error
 
     def test_update_supporting_widget_updates_widget(self):
@@ -5605,9 +5944,10 @@ class TestMorphTripleLabelBehavior:
         assert supporting_widget.text == 'Pre-set Supporting'
 
     def test_update_tertiary_widget_none(self):
-        """Test _update_tertiary_widget when widget is None."""
+        """Test _update_triple_label for tertiary when widget is None."""
         widget = self.TestWidget()
-        widget._update_tertiary_widget(widget, None)
+        widget._update_triple_label(
+            '_tertiary_text', 'tertiary_text', widget, None)
         # Should not raise an error
 
     def test_update_tertiary_widget_updates_widget(self):
@@ -5692,3 +6032,37 @@ class TestMorphTripleLabelBehavior:
         assert heading_widget.text == 'Heading'
         assert supporting_widget.text == 'Supporting'
         assert tertiary_widget.text == 'Tertiary'
+
+
+class TestMorphTrailingWidgetBehavior:
+    """Test suite for MorphTrailingWidgetBehavior class."""
+
+    class TestWidget(MorphTrailingWidgetBehavior, Widget):
+        """Test widget that combines Widget with MorphTrailingWidgetBehavior."""
+
+        def __init__(self, **kwargs):
+            Widget.__init__(self, **kwargs)
+            MorphTrailingWidgetBehavior.__init__(self, **kwargs)
+
+    def test_icons_forwarded_to_trailing_widget(self):
+        """Test state icons are pushed to and kept in sync with the child."""
+        widget = self.TestWidget()
+        trailing_widget = MorphTrailingIconLabel()
+        widget.normal_trailing_icon = 'close'
+        widget.trailing_widget = trailing_widget
+
+        assert trailing_widget.normal_icon == 'close'
+        widget.normal_trailing_icon = 'check'
+        assert trailing_widget.normal_icon == 'check'
+
+    def test_swapped_trailing_widget_is_unbound(self):
+        """Test the previous child no longer receives updates."""
+        widget = self.TestWidget()
+        old_widget = MorphTrailingIconLabel()
+        new_widget = MorphTrailingIconLabel()
+        widget.trailing_widget = old_widget
+        widget.trailing_widget = new_widget
+
+        widget.normal_trailing_icon = 'check'
+        assert new_widget.normal_icon == 'check'
+        assert old_widget.normal_icon != 'check'
@@ -0,0 +1,80 @@
+"""
+Tests for MorphUI list components.
+
+This module contains tests for the BaseListView class, covering how
+items are merged with their defaults and filtered for display.
+"""
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.resolve()))
+
+import morphui.uix.behaviors # Resolves the label/behaviors import cycle
+from morphui.uix.list import BaseListView
+
+
+@pytest.fixture
+def list_view():
+    """Create a BaseListView instance with a few items."""
+    return BaseListView(items=[
+        {'text': 'Apple'},
+        {'text': 'Banana', 'color': 'yellow'},
+        {'text': 'Apricot'},])
+
+
+def test_default_data_merged_into_items(list_view):
+    """Test that default data is applied to every displayed item."""
+    list_view.default_data = {'color': 'red'}
+    assert [d['color'] for d in list_view.data] == ['red', 'yellow', 'red']
+
+
+def test_default_data_change_replaces_previous_defaults(list_view):
+    """Test that changing default data twice replaces the earlier
+    defaults instead of being merged on top of them."""
+    list_view.default_data = {'color': 'red', 'size': 10}
+    list_view.default_data = {'color': 'green'}
+
+    assert [d['color'] for d in list_view.data] == [
+        'green', 'yellow', 'green']
+    assert all('size' not in d for d in list_view.data)
+
+
+def test_filter_value_filters_displayed_items(list_view):
+    """Test that items are filtered case-insensitively."""
+    list_view.filter_value = 'AP'
+    assert [d['text'] for d in list_view.data] == ['Apple', 'Apricot']
+
+    list_view.filter_mode = 'fuzzy'
+    list_view.filter_value = 'bnn'
+    assert [d['text'] for d in list_view.data] == ['Banana']
+
+
+def test_filter_value_converted_once_per_pass(list_view):
+    """Test that the filter value is converted once for all items."""
+
+    class Query:
+        calls = 0
+
+        def __str__(self):
+            Query.calls += 1
+            return 'ap'
+
+    query = Query()
+    list_view.filter_value = query
+    Query.calls = 0
+    assert [d['text'] for d in list_view.items] == ['Apple', 'Apricot']
+    assert Query.calls == 1
+
+
+def test_overridden_should_filter_item_is_used():
+    """Test that a custom should_filter_item decides what is shown."""
+
+    class CustomListView(BaseListView):
+        def should_filter_item(self, item):
+            return 'color' not in item
+
+    list_view = CustomListView(items=[
+        {'text': 'Apple'},
+        {'text': 'Banana', 'color': 'yellow'},])
+    assert [d['text'] for d in list_view.data] == ['Banana']
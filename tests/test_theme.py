@@ -592,6 +592,16 @@ class TestTypography:
             expected_char = chr(int('0F01C9', 16))
             assert character == expected_char
 
+    def test_get_icon_character_follows_icon_map_changes(self):
+        """Test that cached icon characters are refreshed when the
+        icon map changes."""
+        typography = Typography()
+        typography.icon_map['test-icon'] = '0F01C9'
+        assert typography.get_icon_character('test-icon') == chr(0x0F01C9)
+
+        typography.icon_map['test-icon'] = '0F01CA'
+        assert typography.get_icon_character('test-icon') == chr(0x0F01CA)
+
     def test_get_icon_character_invalid_icon(self):
         """Test get_icon_character with invalid icon name."""
         typography = Typography()